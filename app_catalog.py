@@ -0,0 +1,95 @@
+class AppCatalog:
+    """
+    Ordered collection of AppModels indexed by path, name and type.
+
+    Paths are unique: add() ignores an app whose path is already present, so
+    building a catalog from several sources (scan results, manual apps)
+    dedupes in O(1) per app. Lookups by path are O(1); by name and type they
+    return the matching apps in catalog order.
+    """
+
+    def __init__(self, apps=()):
+        # path -> AppModel; dicts keep insertion order, which is catalog order
+        self.by_path = {}
+        # name -> {path: AppModel}
+        self.by_name = {}
+        # app_type -> {path: AppModel}
+        self.by_type = {}
+        self.extend(apps)
+
+    def add(self, app):
+        """Adds app unless its path is already in the catalog. Returns True if added."""
+        if app.path in self.by_path:
+            return False
+        self.by_path[app.path] = app
+        self.by_name.setdefault(app.name, {})[app.path] = app
+        self.by_type.setdefault(app.app_type, {})[app.path] = app
+        return True
+
+    def extend(self, apps):
+        return [app for app in apps if self.add(app)]
+
+    def replace(self, app):
+        # Swap in a new model for a known path, keeping its position
+        old = self.by_path.get(app.path)
+        if old is None:
+            self.add(app)
+            return None
+        self._unindex(old)
+        self.by_path[app.path] = app
+        self.by_name.setdefault(app.name, {})[app.path] = app
+        self.by_type.setdefault(app.app_type, {})[app.path] = app
+        return old
+
+    def remove(self, path):
+        app = self.by_path.pop(path, None)
+        if app is not None:
+            self._unindex(app)
+        return app
+
+    def _unindex(self, app):
+        for index, key in ((self.by_name, app.name), (self.by_type, app.app_type)):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(app.path, None)
+                if not bucket:
+                    del index[key]
+
+    def get(self, path):
+        return self.by_path.get(path)
+
+    def with_name(self, name):
+        return list(self.by_name.get(name, {}).values())
+
+    def of_type(self, app_type):
+        return list(self.by_type.get(app_type, {}).values())
+
+    def paths(self):
+        return self.by_path.keys()
+
+    def difference(self, other):
+        """
+        Compares this catalog (the newer one) against other.
+
+        Returns (added, removed, changed): apps only here, apps only in other,
+        and apps here whose signature differs from other's.
+        """
+        added = [app for path, app in self.by_path.items() if path not in other.by_path]
+        removed = [app for path, app in other.by_path.items() if path not in self.by_path]
+        changed = [
+            app for path, app in self.by_path.items()
+            if path in other.by_path and other.by_path[path].signature != app.signature
+        ]
+        return added, removed, changed
+
+    def __contains__(self, path):
+        return path in self.by_path
+
+    def __iter__(self):
+        return iter(list(self.by_path.values()))
+
+    def __len__(self):
+        return len(self.by_path)
+
+    def __repr__(self):
+        return f"<AppCatalog {len(self)} apps>"
@@ -0,0 +1,160 @@
+import os
+import shutil
+import subprocess
+import threading
+
+from config_manager import ConfigManager
+
+# Apps handed to the UI per "metadata" message
+METADATA_BATCH_SIZE = 16
+GIT_TIMEOUT = 5
+
+class AppMetadata:
+    """Details shown on an app's card, gathered off the UI thread."""
+
+    def __init__(self, mtime=None, entry_size=None, has_venv=False, git_branch=None, git_dirty=False):
+        self.mtime = mtime
+        self.entry_size = entry_size
+        self.has_venv = has_venv
+        self.git_branch = git_branch
+        self.git_dirty = git_dirty
+
+    def __repr__(self):
+        return f"<AppMetadata mtime={self.mtime} branch={self.git_branch} dirty={self.git_dirty}>"
+
+def collect_metadata(app_model):
+    meta = AppMetadata()
+    try:
+        meta.mtime = os.path.getmtime(app_model.path)
+    except OSError:
+        pass
+
+    try:
+        meta.entry_size = os.path.getsize(os.path.join(app_model.path, app_model.entry_point))
+    except OSError:
+        pass
+
+    # Imported here: the scanner isn't needed at startup, this module is
+    from app_scanner import AppScanner
+    meta.has_venv = app_model.venv is not None or any(
+        os.path.isdir(os.path.join(app_model.path, v)) for v in AppScanner.VENV_NAMES
+    )
+
+    meta.git_branch = read_git_branch(app_model.path)
+    if meta.git_branch is not None:
+        meta.git_dirty = is_git_dirty(app_model.path)
+    return meta
+
+def find_git_dir(path):
+    git_path = os.path.join(path, ".git")
+    if os.path.isdir(git_path):
+        return git_path
+    # Worktrees and submodules have a .git file pointing elsewhere
+    try:
+        with open(git_path, "r") as f:
+            line = f.readline().strip()
+    except OSError:
+        return None
+    if line.startswith("gitdir:"):
+        return os.path.normpath(os.path.join(path, line[len("gitdir:"):].strip()))
+    return None
+
+def read_git_branch(path):
+    # Read HEAD directly instead of spawning git just for the branch name
+    git_dir = find_git_dir(path)
+    if git_dir is None:
+        return None
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "r") as f:
+            head = f.readline().strip()
+    except OSError:
+        return None
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    # Detached HEAD
+    return head[:7] or None
+
+_git = None
+
+def is_git_dirty(path):
+    global _git
+    if _git is None:
+        _git = shutil.which("git") or ""
+    if not _git:
+        return False
+
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    try:
+        result = subprocess.run(
+            [_git, "status", "--porcelain", "--untracked-files=no"],
+            cwd=path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=GIT_TIMEOUT,
+            **kwargs
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0 and bool(result.stdout.strip())
+
+class MetadataLoader:
+    """
+    Computes AppMetadata in the background for apps the UI asks about.
+
+    request() queues apps (duplicates are ignored) and returns immediately.
+    A worker thread takes them in batches, probes each batch on a small pool
+    and reports emit("metadata", [(path, AppMetadata), ...]). Like the
+    process reaper, the worker exits when the queue is empty and request()
+    starts a new one when needed.
+    """
+
+    def __init__(self, emit, max_workers=None):
+        self.emit = emit
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        # app path -> AppModel waiting to be probed, in request order
+        self.pending = {}
+        self.worker = None
+
+    def request(self, apps):
+        with self.lock:
+            for app in apps:
+                self.pending.setdefault(app.path, app)
+            if self.pending and (self.worker is None or not self.worker.is_alive()):
+                self.worker = threading.Thread(target=self._work, daemon=True)
+                self.worker.start()
+
+    def discard(self):
+        # Forget queued work, e.g. when the dashboard is rebuilt
+        with self.lock:
+            self.pending.clear()
+
+    def _work(self):
+        # Imported here, off the UI thread, to keep it out of startup
+        from concurrent.futures import ThreadPoolExecutor
+        max_workers = self.max_workers or ConfigManager.get_scan_workers()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            while True:
+                with self.lock:
+                    paths = list(self.pending)[:METADATA_BATCH_SIZE]
+                    batch = [self.pending.pop(p) for p in paths]
+                    if not batch:
+                        self.worker = None
+                        return
+
+                results = []
+                for app, meta in zip(batch, pool.map(self._collect, batch)):
+                    if meta is not None:
+                        results.append((app.path, meta))
+                if results:
+                    self.emit("metadata", results)
+
+    @staticmethod
+    def _collect(app):
+        try:
+            return collect_metadata(app)
+        except Exception as e:
+            print(f"Error reading metadata for {app.path}: {e}")
+            return None
@@ -0,0 +1,25 @@
+class AppModel:
+    """
+    One launchable app. Instances are treated as immutable apart from the
+    lazily loaded metadata: a changed app gets a new AppModel. __slots__
+    keeps the per-app footprint small for large catalogs.
+    """
+
+    __slots__ = ("name", "path", "entry_point", "app_type", "venv", "metadata")
+
+    def __init__(self, name, path, entry_point, app_type="python", venv=None):
+        self.name = name
+        self.path = path
+        self.entry_point = entry_point
+        self.app_type = app_type
+        self.venv = venv
+        # AppMetadata, filled in lazily by the MetadataLoader
+        self.metadata = None
+
+    @property
+    def signature(self):
+        # Everything that decides how the app is shown and launched
+        return (self.name, self.entry_point, self.app_type, self.venv)
+
+    def __repr__(self):
+        return f"<AppModel {self.name} ({self.entry_point})>"
@@ -1,88 +1,372 @@
-
 import os
-import glob
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from config_manager import ConfigManager
-
-class AppModel:
-    def __init__(self, name, path, entry_point, app_type="python"):
-        self.name = name
-        self.path = path
-        self.entry_point = entry_point
-        self.app_type = app_type
-
-    def __repr__(self):
-        return f"<AppModel {self.name} ({self.entry_point})>"
+from scan_index import ScanIndex
+from scan_filter import ExcludeRules
+# Re-exported: AppModel used to live here
+from app_model import AppModel
 
 class AppScanner:
     IGNORED_FOLDERS = {".git", ".idea", "__pycache__", ".vscode", "venv", ".venv", "node_modules"}
     ENTRY_POINTS = ["main.py", "app.py", "index.py", "start.py", "manage.py"]
+    BATCH_EXTENSIONS = (".bat", ".cmd")
+    VENV_NAMES = ["venv", ".venv", "env"]
+
+    @staticmethod
+    def scan(roots, max_workers=None, index=None, max_depth=None, exclude=None, cancel=None):
+        """
+        Scans one root folder, or a list of them, for apps.
+
+        Folders down to max_depth levels below each root are considered
+        (defaulting to the "scan_depth" config value; 1 = direct children
+        only). A folder recognized as an app is not descended into, and
+        folders matching the gitignore-style exclude patterns (IGNORED_FOLDERS
+        plus "scan_exclude" from config by default) are skipped entirely.
+
+        Folders are probed on a bounded thread pool (max_workers, defaulting to
+        the "scan_workers" config value), with all roots walked concurrently.
+        With max_workers <= 1 the scan runs serially. Either way the returned
+        list is ordered by root, then path, and holds each path once.
+
+        Folders whose mtime matches the persistent scan index are not listed
+        again. index defaults to the shared ScanIndex; pass False to disable.
+
+        cancel is an optional threading.Event. Once it is set, no further
+        folders are visited and the apps found so far are returned.
+        """
+        roots = AppScanner._roots(roots)
+        order = {root: i for i, root in enumerate(roots)}
+        apps = list(AppScanner.iter_scan(roots, max_workers, index, max_depth, exclude, cancel))
+        apps.sort(key=lambda app: (order.get(AppScanner._root_of(app.path, roots), 0), app.path))
+        return apps
 
     @staticmethod
-    def scan(root_dir):
+    def iter_scan(roots, max_workers=None, index=None, max_depth=None, exclude=None, cancel=None):
+        """
+        Streaming variant of scan(): yields each AppModel as soon as its
+        folder has been probed, in completion order. Paths found under
+        several (overlapping) roots are only yielded once.
+        """
+        roots = AppScanner._roots(roots)
+        if not roots:
+            return
+
+        walk = _Walk(index, max_depth, exclude, roots, cancel)
+        if max_workers is None:
+            max_workers = ConfigManager.get_scan_workers()
+
+        yielded = set()
+        if max_workers <= 1:
+            pending = deque((root, "", None, 0) for root in roots)
+            while pending:
+                app, children = walk.visit(*pending.popleft())
+                pending.extend(children)
+                if app and app.path not in yielded:
+                    yielded.add(app.path)
+                    yield app
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                pending = {pool.submit(walk.visit, root, "", None, 0) for root in roots}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        app, children = future.result()
+                        for child in children:
+                            pending.add(pool.submit(walk.visit, *child))
+                        if app and app.path not in yielded:
+                            yielded.add(app.path)
+                            yield app
+            finally:
+                # Also reached when the consumer abandons the generator early
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        walk.finish(roots)
+
+    @staticmethod
+    def scan_subtree(root_dir, item, index=None, max_depth=None, exclude=None, roots=()):
+        """
+        Apps at or below root_dir/item, as a full scan of root_dir would
+        find them there. item is a "/"-separated path relative to root_dir,
+        at any depth. Used to re-probe a single changed folder.
+
+        roots are all the roots being scanned; as in scan(), folders that
+        are roots of their own are left to those.
+        """
+        walk = _Walk(index, max_depth, exclude, AppScanner._roots(roots))
         apps = []
-        if not root_dir or not os.path.isdir(root_dir):
-            return apps
+        pending = deque([(os.path.normpath(root_dir), item, None, item.count("/") + 1)])
+        while pending:
+            app, children = walk.visit(*pending.popleft())
+            pending.extend(children)
+            if app:
+                apps.append(app)
+        if walk.index:
+            walk.index.save()
+        return apps
 
-        overrides = ConfigManager.get_app_overrides()
-        ignored = ConfigManager.get_ignored_apps()
+    @staticmethod
+    def folders(root_dir, item="", index=None, max_depth=None, exclude=None, roots=()):
+        """
+        (rel, full_path) of every folder at or below root_dir/item that a
+        scan would look at: excluded folders and other roots are left out
+        and app folders are not descended into. With the default item,
+        root_dir itself is not included. Used by the folder watcher to pick
+        what to watch.
+        """
+        walk = _Walk(index, max_depth, exclude, AppScanner._roots(roots))
+        return list(walk.folders(os.path.normpath(root_dir), item))
 
-        # List immediate subdirectories
+    @staticmethod
+    def _roots(roots):
+        if isinstance(roots, str):
+            roots = [roots]
+        result = []
+        for root in roots or []:
+            if not root:
+                continue
+            root = os.path.normpath(root)
+            if root not in result and os.path.isdir(root):
+                result.append(root)
+        return result
+
+    @staticmethod
+    def _root_of(path, roots):
+        # Longest root containing path
+        best = None
+        for root in roots:
+            if path.startswith(os.path.join(root, "")) and (best is None or len(root) > len(best)):
+                best = root
+        return best
+
+    @staticmethod
+    def list_folder(folder_path, subdirs=None):
+        """
+        Reads a folder once and returns (file_names, venv_name).
+
+        file_names keeps listing order. venv_name is the first of VENV_NAMES
+        present as a directory, or None. If a subdirs list is passed, the
+        DirEntry of every other subfolder is appended to it.
+        """
+        files = []
+        venv_dirs = set()
         try:
-            items = os.listdir(root_dir)
-        except PermissionError:
-            return apps
-
-        for item in items:
-            full_path = os.path.join(root_dir, item)
-            
-            # Skip ignored apps
-            if full_path in ignored or item in ignored: # Check full path or folder name (just in case)
-                 continue
-
-            if os.path.isdir(full_path) and item not in AppScanner.IGNORED_FOLDERS:
-                # Check for override
-                entry_point = overrides.get(str(full_path))
-                
-                if not entry_point:
-                     # Check for entry point
-                    entry_point = AppScanner.detect_entry_point(full_path)
-                
-                if entry_point:
-                    apps.append(AppModel(
-                        name=item,
-                        path=full_path,
-                        entry_point=entry_point
-                    ))
-                else:
-                    # Optional: Include folder even if no strict entry point is found? 
-                    # The user said "detect the apps... name them as their folder"
-                    # If we don't find a main.py, maybe we shouldn't list it, or list it as "Unknown".
-                    # For now, let's only list if we find a likely python file to run.
-                    # Or maybe just pick the first .py file if standard ones aren't found?
-                    fallback = AppScanner.find_any_python_file(full_path)
-                    if fallback:
-                         apps.append(AppModel(
-                            name=item,
-                            path=full_path,
-                            entry_point=fallback
-                        ))
-                    
-        return apps
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            files.append(entry.name)
+                        elif entry.name in AppScanner.VENV_NAMES and entry.is_dir():
+                            venv_dirs.add(entry.name)
+                        elif subdirs is not None and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry)
+                    except OSError:
+                        continue
+        except OSError:
+            return [], None
+
+        venv = next((v for v in AppScanner.VENV_NAMES if v in venv_dirs), None)
+        return files, venv
+
+    @staticmethod
+    def resolve_entry_point(files):
+        """
+        Picks the entry point from a folder listing.
+
+        Priority: ENTRY_POINTS in order, then the first other .py file, then the
+        first .bat/.cmd file. Returns (entry_point, app_type) or (None, None).
+        """
+        names = set(files)
+        for ep in AppScanner.ENTRY_POINTS:
+            if ep in names:
+                return ep, "python"
+
+        # Fallback: any .py file that isn't __init__.py
+        # This might be risky, but useful for random scripts
+        batch = None
+        for name in files:
+            ext = os.path.splitext(name)[1].lower()
+            if ext == ".py" and name != "__init__.py":
+                return name, "python"
+            if batch is None and ext in AppScanner.BATCH_EXTENSIONS:
+                batch = name
+
+        if batch:
+            return batch, "batch"
+        return None, None
 
     @staticmethod
     def detect_entry_point(folder_path):
+        files, _ = AppScanner.list_folder(folder_path)
+        names = set(files)
         for ep in AppScanner.ENTRY_POINTS:
-            if os.path.exists(os.path.join(folder_path, ep)):
+            if ep in names:
                 return ep
         return None
 
     @staticmethod
     def find_any_python_file(folder_path):
-        # Fallback: look for any .py file that isn't __init__.py
-        # This might be risky, but useful for random scripts
-        py_files = glob.glob(os.path.join(folder_path, "*.py"))
-        for f in py_files:
-            basename = os.path.basename(f)
-            if basename != "__init__.py":
-                return basename
+        files, _ = AppScanner.list_folder(folder_path)
+        for name in files:
+            if os.path.splitext(name)[1].lower() == ".py" and name != "__init__.py":
+                return name
         return None
+
+class _Walk:
+    """
+    State shared by the folder visits of one (recursive) scan: config
+    snapshot, compiled exclude rules, the scan index and the set of folders
+    seen so far. visit() is called from pool threads.
+    """
+
+    def __init__(self, index, max_depth, exclude, roots=(), cancel=None):
+        self.index = ScanIndex.shared() if index is None else index
+        self.max_depth = max(1, ConfigManager.get_scan_depth() if max_depth is None else max_depth)
+        if exclude is None:
+            exclude = ConfigManager.get_scan_exclude()
+        self.rules = ExcludeRules(sorted(AppScanner.IGNORED_FOLDERS) + list(exclude))
+        self.overrides = ConfigManager.get_app_overrides()
+        self.ignored = set(ConfigManager.get_ignored_apps())
+        self.max_dirs = ConfigManager.get_scan_max_dirs()
+        self.lock = threading.Lock()
+        self.seen = set()
+        self.truncated = False
+        # A root nested inside another is only walked as its own root
+        self.roots = set(roots)
+        self.cancel = cancel
+
+    def visit(self, root, rel, entry, depth):
+        """
+        Probes one folder. Returns (app or None, child visits), where each
+        child visit is a (root, rel, entry, depth) tuple for visit().
+        """
+        if self.cancel is not None and self.cancel.is_set():
+            # Queued visits of a cancelled scan drain without touching the disk
+            return None, []
+        if depth == 0:
+            return None, self.list_root(root)
+
+        full_path = os.path.join(root, rel.replace("/", os.sep))
+        if not self.admits(rel, full_path, entry):
+            return None, []
+
+        with self.lock:
+            if len(self.seen) >= self.max_dirs:
+                if not self.truncated:
+                    print(f"Scan stopped after {self.max_dirs} folders; raise scan_max_dirs or narrow scan_exclude")
+                    self.truncated = True
+                return None, []
+            self.seen.add(full_path)
+
+        descend = depth < self.max_depth
+        detected, app_type, venv, subdirs = self.inspect(full_path, entry, descend)
+
+        # Check for override
+        entry_point = self.overrides.get(str(full_path))
+        if entry_point:
+            is_batch = os.path.splitext(entry_point)[1].lower() in AppScanner.BATCH_EXTENSIONS
+            app_type = "batch" if is_batch else "python"
+        else:
+            entry_point = detected
+
+        if entry_point:
+            # An app's own subfolders are never scanned for further apps
+            return AppModel(name=rel, path=full_path, entry_point=entry_point, app_type=app_type, venv=venv), []
+
+        if not descend:
+            return None, []
+        return None, [(root, f"{rel}/{child}", child_entry, depth + 1) for child, child_entry in subdirs]
+
+    def admits(self, rel, full_path, entry):
+        # Skip ignored apps, excluded folders, nested roots and non-folders
+        name = rel.rsplit("/", 1)[-1]
+        if full_path in self.roots:
+            return False
+        if full_path in self.ignored or name in self.ignored or rel in self.ignored:
+            return False
+        if self.rules.excluded(rel):
+            return False
+        try:
+            return entry.is_dir() if entry is not None else os.path.isdir(full_path)
+        except OSError:
+            return False
+
+    def folders(self, root, rel=""):
+        """
+        Yields (rel, full_path) for the folders visit() would reach from
+        root/rel, without building AppModels or touching the dir cap.
+        """
+        pending = deque([(rel, None, rel.count("/") + 1 if rel else 0)])
+        while pending:
+            rel, entry, depth = pending.popleft()
+            if depth == 0:
+                children = [(e.name, e) for _, _, e, _ in self.list_root(root)]
+            else:
+                full_path = os.path.join(root, rel.replace("/", os.sep))
+                if not self.admits(rel, full_path, entry):
+                    continue
+                if depth > self.max_depth:
+                    continue
+                yield rel, full_path
+                if depth >= self.max_depth:
+                    continue
+                detected, _, _, children = self.inspect(full_path, entry, True)
+                if detected or self.overrides.get(full_path):
+                    # An app: its subfolders are never scanned, so not watched
+                    continue
+            for name, child_entry in children:
+                pending.append((f"{rel}/{name}" if rel else name, child_entry, depth + 1))
+
+    def list_root(self, root):
+        # DirEntry carries the file type from the listing, so is_dir() in
+        # visit() doesn't cost a stat. Symlinked folders are followed here only.
+        try:
+            with os.scandir(root) as it:
+                return [(root, entry.name, entry, 1) for entry in it]
+        except OSError as e:
+            print(f"Error scanning {root}: {e}")
+            return []
+
+    def inspect(self, full_path, entry, descend):
+        """
+        Returns (entry_point, app_type, venv, subdirs) for a folder, where
+        subdirs is a list of (name, DirEntry or None) to descend into.
+
+        With an index, the folder is only listed when its mtime differs from
+        the cached one, or when subfolders are needed and weren't recorded.
+        """
+        mtime = None
+        if self.index:
+            try:
+                st = entry.stat() if entry is not None else os.stat(full_path)
+            except OSError:
+                return None, None, None, []
+            mtime = st.st_mtime_ns
+            cached = self.index.get(full_path, mtime)
+            if cached is not None:
+                if cached[0] or not descend:
+                    return cached + ([],)
+                names = self.index.get_subdirs(full_path, mtime)
+                if names is not None:
+                    return cached + ([(n, None) for n in names],)
+
+        entries = [] if descend else None
+        files, venv = AppScanner.list_folder(full_path, subdirs=entries)
+        entry_point, app_type = AppScanner.resolve_entry_point(files)
+        subdirs = [(e.name, e) for e in entries or []]
+
+        if self.index:
+            names = [n for n, _ in subdirs] if descend and not entry_point else None
+            self.index.put(full_path, mtime, entry_point, app_type, venv, subdirs=names)
+        return entry_point, app_type, venv, subdirs
+
+    def finish(self, roots):
+        if not self.index:
+            return
+        if not self.truncated and not (self.cancel is not None and self.cancel.is_set()):
+            # Forget folders that vanished since the last scan
+            for root in roots:
+                self.index.retain(root, self.seen)
+        self.index.save()
@@ -0,0 +1,82 @@
+"""
+Launch benchmark: cold interpreter vs. WarmPool worker.
+
+Times how long it takes from "launch" until a small tool has imported its
+modules and printed its first line, which is what the user perceives as
+click-to-window latency.
+
+    python bench_launch.py --runs 10
+    python bench_launch.py --interpreter path/to/venv/bin/python --imports json logging tkinter
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from warm_pool import WarmPool, DEFAULT_MODULES
+
+def write_tool(folder, imports):
+    script = os.path.join(folder, "tool.py")
+    with open(script, "w") as f:
+        for name in imports:
+            f.write(f"import {name}\n")
+        f.write("print('ready', flush=True)\n")
+    return script
+
+def cold_launch(interpreter, script, cwd):
+    start = time.perf_counter()
+    popen = subprocess.Popen([interpreter, "-u", script], cwd=cwd, stdout=subprocess.PIPE)
+    popen.stdout.readline()
+    elapsed = time.perf_counter() - start
+    popen.wait()
+    return elapsed
+
+def warm_launch(pool, interpreter, script, cwd):
+    # Wait (untimed) until a worker is ready, as it would be in steady state
+    pool.warm(interpreter)
+    deadline = time.monotonic() + 30
+    while pool.ready_count(interpreter) == 0:
+        if time.monotonic() > deadline:
+            raise RuntimeError("warm worker never became ready")
+        time.sleep(0.01)
+
+    start = time.perf_counter()
+    worker = pool.acquire(interpreter)
+    popen = worker.start(script, cwd)
+    popen.stdout.readline()
+    elapsed = time.perf_counter() - start
+    popen.wait()
+    return elapsed
+
+def summarize(label, samples):
+    ms = [s * 1000 for s in samples]
+    print(f"{label:<6} median {statistics.median(ms):7.1f} ms   min {min(ms):7.1f} ms   max {max(ms):7.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold vs. warm app launches")
+    parser.add_argument("--interpreter", default=sys.executable)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--imports", nargs="+", default=["json", "logging", "argparse", "subprocess", "socket"])
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix="appmgr_launch_")
+    pool = WarmPool(size=1, modules=DEFAULT_MODULES)
+    try:
+        script = write_tool(folder, args.imports)
+
+        cold = [cold_launch(args.interpreter, script, folder) for _ in range(args.runs)]
+        warm = [warm_launch(pool, args.interpreter, script, folder) for _ in range(args.runs)]
+
+        summarize("cold", cold)
+        summarize("warm", warm)
+        print(f"speedup x{statistics.median(cold) / statistics.median(warm):.2f}")
+    finally:
+        pool.shutdown()
+        shutil.rmtree(folder, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
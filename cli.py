@@ -0,0 +1,273 @@
+"""
+Headless entry point: scan, list, run and stop apps without the GUI.
+
+    python cli.py scan [--ndjson] [--parallel N] [--depth N] [--root DIR ...]
+    python cli.py list [--refresh] [--ndjson]
+    python cli.py run APP [APP ...] [--parallel N]
+    python cli.py stop APP [APP ...] | --all
+    python cli.py status [--ndjson]
+
+APP is an app path or name. Results are printed to stdout as JSON, or as
+one JSON object per line with --ndjson (scan always streams that way when
+asked). Diagnostics go to stderr. Exits with 1 if any app could not be
+found, launched or stopped.
+
+Nothing here imports tkinter/customtkinter, so it starts without a display.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+from config_manager import ConfigManager
+from app_scanner import AppScanner
+from app_model import AppModel
+from app_catalog import AppCatalog
+from process_state import ProcessStateFile, is_same_process
+
+# JSON goes to the real stdout; the modules below report problems with
+# print(), which would corrupt it, so those are sent to stderr instead
+OUT = sys.stdout
+
+def write(obj):
+    OUT.write(json.dumps(obj) + "\n")
+    OUT.flush()
+
+def app_to_dict(app):
+    return {
+        "name": app.name,
+        "path": app.path,
+        "entry_point": app.entry_point,
+        "app_type": app.app_type,
+        "venv": app.venv
+    }
+
+def scan_roots(args):
+    return args.root or ConfigManager.get_scan_roots()
+
+def add_manual_apps(catalog):
+    # Same rule as the GUI: scanned apps win over manual entries for a path
+    for app_data in ConfigManager.get_manual_apps():
+        if app_data["path"] not in catalog:
+            catalog.add(AppModel(
+                name=app_data["name"],
+                path=app_data["path"],
+                entry_point=app_data["entry_point"]
+            ))
+
+def load_catalog(refresh=False, workers=None):
+    """Apps from the GUI's last scan snapshot, or from a fresh scan."""
+    from scan_snapshot import load_snapshot, save_snapshot
+
+    root_dir = ConfigManager.get_root_dir()
+    apps = None if refresh or not root_dir else load_snapshot(root_dir)
+    if apps is None:
+        catalog = AppCatalog(AppScanner.scan(ConfigManager.get_scan_roots(), max_workers=workers))
+        add_manual_apps(catalog)
+        if root_dir:
+            save_snapshot(root_dir, list(catalog))
+        return catalog
+    return AppCatalog(apps)
+
+def resolve(catalog, target):
+    """Finds an app by path or name; a folder not in the catalog is probed."""
+    path = os.path.normpath(os.path.abspath(target))
+    app = catalog.get(path) or catalog.get(target)
+    if app is not None:
+        return app
+
+    named = catalog.with_name(target)
+    if len(named) == 1:
+        return named[0]
+    if len(named) > 1:
+        print(f"{target} is ambiguous: {', '.join(a.path for a in named)}")
+        return None
+
+    if os.path.isdir(path):
+        files, venv = AppScanner.list_folder(path)
+        entry_point = ConfigManager.get_app_overrides().get(path)
+        app_type = "python"
+        if entry_point:
+            if os.path.splitext(entry_point)[1].lower() in AppScanner.BATCH_EXTENSIONS:
+                app_type = "batch"
+        else:
+            entry_point, app_type = AppScanner.resolve_entry_point(files)
+        if entry_point:
+            return AppModel(os.path.basename(path), path, entry_point, app_type, venv)
+    return None
+
+def cmd_scan(args):
+    roots = scan_roots(args)
+    start = time.perf_counter()
+    count = 0
+    apps = []
+    for app in AppScanner.iter_scan(roots, max_workers=args.parallel, max_depth=args.depth):
+        count += 1
+        if args.ndjson:
+            write(app_to_dict(app))
+        else:
+            apps.append(app)
+
+    elapsed = round(time.perf_counter() - start, 4)
+    if args.ndjson:
+        write({"done": True, "apps": count, "seconds": elapsed})
+    else:
+        apps.sort(key=lambda app: app.path)
+        write({"roots": roots, "seconds": elapsed, "apps": [app_to_dict(app) for app in apps]})
+    return 0
+
+def cmd_list(args):
+    catalog = load_catalog(refresh=args.refresh, workers=args.parallel)
+    if args.ndjson:
+        for app in catalog:
+            write(app_to_dict(app))
+    else:
+        write([app_to_dict(app) for app in catalog])
+    return 0
+
+def cmd_run(args):
+    from process_runner import ProcessRunner
+
+    catalog = load_catalog(workers=args.parallel)
+    state = ProcessStateFile.shared()
+
+    def launch(target):
+        app = resolve(catalog, target)
+        if app is None:
+            return {"target": target, "state": "not_found"}
+
+        result = {"target": target, "name": app.name, "path": app.path}
+        running = state.get(app.path)
+        if running is not None:
+            return dict(result, state="already_running", pid=running["pid"])
+
+        # The apps must outlive this process, so no pipes back to it and no
+        # warm workers (those are our children and would be tied to us);
+        # their output goes to their log file instead of our stdout
+        record = ProcessRunner.run_app(app, detached=True)
+        if record is None:
+            return dict(result, state="failed")
+        state.add(app.path, app.name, record.pid, record.start_time)
+        return dict(result, state="started", pid=record.pid)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.parallel or 1)) as pool:
+        results = list(pool.map(launch, args.apps))
+
+    for result in results:
+        write(result)
+    return 0 if all(r["state"] in ("started", "already_running") for r in results) else 1
+
+def cmd_stop(args):
+    from process_runner import ProcessRunner
+
+    state = ProcessStateFile.shared()
+    entries = state.entries()
+    unknown = set()
+    if args.all:
+        targets = list(entries)
+    else:
+        catalog = load_catalog()
+        targets = []
+        for target in args.apps:
+            app = resolve(catalog, target)
+            if app is None:
+                # Still stoppable by the path it was launched with
+                unknown.add(target)
+            targets.append(app.path if app is not None else target)
+
+    backend = ProcessRunner.backend()
+    failed = False
+    for path in targets:
+        entry = entries.get(path)
+        if entry is None:
+            if path in unknown:
+                write({"path": path, "state": "unknown"})
+                failed = True
+            else:
+                write({"path": path, "state": "not_running"})
+            continue
+        if not is_same_process(entry):
+            # The pid was recycled since it was recorded; never signal it
+            state.remove(path, entry["pid"])
+            write({"path": path, "name": entry["name"], "pid": entry["pid"], "state": "stale"})
+            continue
+        try:
+            # terminate() only needs the pid of the launched process
+            backend.terminate(types.SimpleNamespace(pid=entry["pid"]))
+        except Exception as e:
+            print(f"Error stopping {entry['name']}: {e}")
+            write({"path": path, "name": entry["name"], "pid": entry["pid"], "state": "failed"})
+            failed = True
+            continue
+        state.remove(path, entry["pid"])
+        write({"path": path, "name": entry["name"], "pid": entry["pid"], "state": "stopped"})
+    return 1 if failed else 0
+
+def cmd_status(args):
+    now = time.time()
+    rows = [
+        {
+            "path": path,
+            "name": entry["name"],
+            "pid": entry["pid"],
+            "uptime": round(now - entry["start_time"], 1)
+        }
+        for path, entry in sorted(ProcessStateFile.shared().entries().items())
+    ]
+    if args.ndjson:
+        for row in rows:
+            write(row)
+    else:
+        write(rows)
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="app-manager", description="App Manager without the GUI")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan = commands.add_parser("scan", help="scan the projects folders for apps")
+    scan.add_argument("--root", action="append", help="folder to scan (repeatable; default: configured roots)")
+    scan.add_argument("--depth", type=int, help="folder levels below each root that may hold apps")
+    scan.set_defaults(func=cmd_scan)
+
+    lst = commands.add_parser("list", help="list known apps, from the last scan when available")
+    lst.add_argument("--refresh", action="store_true", help="scan instead of using the last scan")
+    lst.set_defaults(func=cmd_list)
+
+    run = commands.add_parser("run", help="launch apps by path or name")
+    run.add_argument("apps", nargs="+")
+    run.set_defaults(func=cmd_run)
+
+    stop = commands.add_parser("stop", help="stop apps launched by any App Manager process")
+    stop.add_argument("apps", nargs="*")
+    stop.add_argument("--all", action="store_true")
+    stop.set_defaults(func=cmd_stop)
+
+    status = commands.add_parser("status", help="show running apps")
+    status.set_defaults(func=cmd_status)
+
+    for sub in (scan, lst, run, stop, status):
+        sub.add_argument("--ndjson", action="store_true", help="one JSON object per line")
+        sub.add_argument("--parallel", type=int, default=None,
+                         help="scan workers, or apps launched at once for run")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "stop" and not args.apps and not args.all:
+        print("stop: give at least one app, or --all", file=sys.stderr)
+        return 2
+
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        return args.func(args)
+    finally:
+        sys.stdout = stdout
+        ConfigManager.flush()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,461 @@
-
+import atexit
 import json
 import os
+import sys
+import threading
+import time
 
-CONFIG_FILE = "config.json"
+APP_DIR_NAME = "AppManager"
 
-class ConfigManager:
-    @staticmethod
-    def load_config():
+
+def _install_dir():
+    # Folder holding the exe when frozen, or the sources in development
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(os.path.abspath(sys.executable))
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def resolve_config_dir():
+    """
+    Where config and caches live, independent of the working directory:
+    1. APP_MANAGER_CONFIG_DIR, if set.
+    2. The install dir, if it already has a config (the installer writes
+       one there, and it keeps portable copies self-contained).
+    3. The per-user config dir: %APPDATA%\\AppManager on Windows,
+       ~/Library/Application Support/AppManager on macOS, and
+       $XDG_CONFIG_HOME/AppManager (default ~/.config) elsewhere.
+    """
+    override = os.environ.get("APP_MANAGER_CONFIG_DIR")
+    if override:
+        return os.path.abspath(os.path.expanduser(override))
+
+    install = _install_dir()
+    if any(os.path.exists(os.path.join(install, name)) for name in ("config.json", "config.db")):
+        return install
+
+    if os.name == "nt":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return os.path.join(base, APP_DIR_NAME)
+
+
+CONFIG_DIR = resolve_config_dir()
+CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
+CONFIG_DB = os.path.join(CONFIG_DIR, "config.db")
+SCAN_CACHE_FILE = os.path.join(CONFIG_DIR, "scan_cache.json")
+SCAN_SNAPSHOT_FILE = os.path.join(CONFIG_DIR, "last_scan.json")
+PROCESS_STATE_FILE = os.path.join(CONFIG_DIR, "processes.json")
+LOG_DIR = os.path.join(CONFIG_DIR, "logs")
+
+
+try:
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+except OSError as e:
+    print(f"Could not create config dir {CONFIG_DIR}: {e}")
+
+# How long whole-document saves are held in memory before being written
+# back, so a burst of save_config() calls results in a single write.
+SAVE_DELAY = 0.5
+
+# Journal entries replayed on load before the journal is folded back into
+# config.json
+COMPACT_THRESHOLD = 64
+
+# A config file that can't be opened (another process holding it, a
+# Windows sharing violation) is retried this often before giving up
+READ_RETRIES = 5
+READ_RETRY_DELAY = 0.05
+
+DEFAULT_SCAN_WORKERS = 8
+DEFAULT_SCAN_DEPTH = 1
+# Hard cap on folders visited per scan, so a misconfigured root can't walk a whole disk
+DEFAULT_SCAN_MAX_DIRS = 200000
+
+
+def _default_config():
+    return {"manual_apps": [], "app_overrides": {}, "ignored_apps": []}
+
+
+def _journal_path():
+    return CONFIG_FILE + ".journal"
+
+
+def _apply_op(config, op):
+    """
+    Applies one journal entry to config in place; returns False if it was a
+    no-op. Every op is idempotent, so replaying a journal on top of a
+    snapshot that already contains some of it is harmless.
+
+      ["set", key, value]             config[key] = value
+      ["set_item", key, field, value] config[key][field] = value
+      ["del_item", key, field]        del config[key][field]
+      ["append", key, value]          add to list (by "path" for dicts)
+      ["remove", key, path]           drop list entries equal to / with that path
+    """
+    kind, key = op[0], op[1]
+    if kind == "set":
+        if key in config and config[key] == op[2]:
+            return False
+        config[key] = op[2]
+    elif kind == "set_item":
+        items = config.setdefault(key, {})
+        if op[2] in items and items[op[2]] == op[3]:
+            return False
+        items[op[2]] = op[3]
+    elif kind == "del_item":
+        items = config.get(key, {})
+        if op[2] not in items:
+            return False
+        del items[op[2]]
+    elif kind == "append":
+        items = config.setdefault(key, [])
+        value = op[2]
+        if isinstance(value, dict):
+            if any(isinstance(i, dict) and i.get("path") == value.get("path") for i in items):
+                return False
+        elif value in items:
+            return False
+        items.append(value)
+    elif kind == "remove":
+        items = config.get(key, [])
+        kept = [i for i in items if i != op[2] and not (isinstance(i, dict) and i.get("path") == op[2])]
+        if len(kept) == len(items):
+            return False
+        config[key] = kept
+    else:
+        raise ValueError(f"Unknown config op: {kind}")
+    return True
+
+
+class _FileLock:
+    """
+    Advisory lock on a sidecar file, so separate manager processes (the GUI
+    and scripts) don't interleave journal appends and compactions. Re-entrant
+    within a process; callers already serialize threads with _ConfigCache.lock.
+    """
+
+    def __init__(self, path_fn):
+        self.path_fn = path_fn
+        self.handle = None
+        self.depth = 0
+
+    def __enter__(self):
+        self.depth += 1
+        if self.depth == 1:
+            try:
+                self.handle = open(self.path_fn(), "a+b")
+                if os.name == "nt":
+                    import msvcrt
+                    self.handle.seek(0)
+                    msvcrt.locking(self.handle.fileno(), msvcrt.LK_LOCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+            except OSError as e:
+                # A read-only install dir shouldn't make config unusable
+                print(f"Config lock unavailable: {e}")
+                if self.handle is not None:
+                    self.handle.close()
+                self.handle = None
+        return self
+
+    def __exit__(self, *exc):
+        self.depth -= 1
+        if self.depth == 0 and self.handle is not None:
+            try:
+                if os.name == "nt":
+                    import msvcrt
+                    self.handle.seek(0)
+                    msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+            finally:
+                self.handle.close()
+                self.handle = None
+        return False
+
+
+class _ConfigCache:
+    """
+    Process-wide copy of config.json.
+
+    The document on disk is config.json plus an append-only journal of small
+    mutations (config.json.journal). Single-field edits such as
+    add_ignored_app append one line to the journal instead of rewriting the
+    whole file; once COMPACT_THRESHOLD entries have piled up, or on exit,
+    the journal is folded into a fresh config.json written atomically.
+    Whole-document save_config() calls are debounced and also compact.
+
+    Both files are only re-read when their mtime/size changes on disk, and
+    all disk access happens under a file lock shared with other processes.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.file_lock = _FileLock(lambda: CONFIG_FILE + ".lock")
+        self.data = None
+        self.stamp = None
+        self.dirty = False
+        self.timer = None
+        # Entries in the journal on disk, and whether it ends in a torn line
+        self.journal_entries = 0
+        self.journal_torn = False
+        # (data dict, set of manual app paths) for O(1) has_manual_app()
+        self.manual = None
+
+    def _disk_stamp(self):
+        stamp = []
+        for path in (CONFIG_FILE, _journal_path()):
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def get(self):
+        with self.lock:
+            # Pending in-memory changes always win over the file on disk
+            if self.dirty and self.data is not None:
+                return self.data
+
+            stamp = self._disk_stamp()
+            if self.data is None or stamp != self.stamp:
+                with self.file_lock:
+                    try:
+                        data = self._read()
+                    except OSError as e:
+                        if self.data is None:
+                            raise
+                        # Keep serving what we had; the stamp is left stale
+                        # so the next get() tries again
+                        print(f"Error reading {CONFIG_FILE}: {e}; keeping the loaded config")
+                        return self.data
+                    self.stamp = self._disk_stamp()
+                    self.data = data
+            return self.data
+
+    def _read(self):
+        data = _default_config()
         if os.path.exists(CONFIG_FILE):
+            try:
+                data = self._load_file()
+            except ValueError as e:
+                # Only bad JSON counts as corruption. Keep the broken file for
+                # inspection instead of silently overwriting it with defaults
+                # on the next save
+                backup = CONFIG_FILE + ".corrupt"
+                print(f"Error reading {CONFIG_FILE}: {e}; moved to {backup}")
+                try:
+                    os.replace(CONFIG_FILE, backup)
+                except OSError:
+                    pass
+
+        self.journal_entries = 0
+        self.journal_torn = False
+        try:
+            with open(_journal_path(), "r") as f:
+                for line in f:
+                    try:
+                        op = json.loads(line)
+                    except ValueError:
+                        # Torn final append from a crash; everything before it is
+                        # good, but nothing may be appended after it
+                        self.journal_torn = True
+                        break
+                    try:
+                        _apply_op(data, op)
+                    except (ValueError, IndexError, TypeError, AttributeError) as e:
+                        print(f"Skipping bad config journal entry {line.strip()!r}: {e}")
+                    self.journal_entries += 1
+        except OSError:
+            pass
+        return data
+
+    @staticmethod
+    def _load_file():
+        # An OSError here is transient or a permissions problem, not a bad
+        # file: retry, then let it propagate with the file left in place
+        for attempt in range(READ_RETRIES):
             try:
                 with open(CONFIG_FILE, "r") as f:
                     return json.load(f)
-            except:
-                return {"manual_apps": [], "app_overrides": {}, "ignored_apps": []}
-        return {"manual_apps": [], "app_overrides": {}, "ignored_apps": []}
+            except FileNotFoundError:
+                return _default_config()
+            except OSError:
+                if attempt == READ_RETRIES - 1:
+                    raise
+                time.sleep(READ_RETRY_DELAY)
+
+    def mutate(self, op):
+        with self.lock, self.file_lock:
+            # Re-validate against disk under the lock so another process's
+            # journal entries are applied before ours is appended
+            data = self.get()
+            if not _apply_op(data, op):
+                return
+            self._track_manual(data, op)
+            if self.dirty:
+                # A whole-document save is pending and will include this
+                return
+            if self.journal_torn:
+                self.dirty = True
+                self.flush()
+                return
+
+            try:
+                with open(_journal_path(), "a") as f:
+                    f.write(json.dumps(op) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                print(f"Error writing config journal: {e}")
+                self.dirty = True
+                self.flush()
+                return
+
+            self.journal_entries += 1
+            if self.journal_entries >= COMPACT_THRESHOLD:
+                self.dirty = True
+                self.flush()
+            else:
+                self.stamp = self._disk_stamp()
+
+    def has_manual_app(self, path):
+        with self.lock:
+            data = self.get()
+            # Rebuilt only when the dict itself was replaced (reload, put)
+            if self.manual is None or self.manual[0] is not data:
+                self.manual = (data, {app["path"] for app in data.get("manual_apps", [])})
+            return path in self.manual[1]
+
+    def _track_manual(self, data, op):
+        # Keep the manual path set in step with an op just applied to data
+        if self.manual is None or self.manual[0] is not data or op[1] != "manual_apps":
+            return
+        if op[0] == "append":
+            self.manual[1].add(op[2]["path"])
+        elif op[0] == "remove":
+            self.manual[1].discard(op[2])
+        else:
+            self.manual = None
+
+    def put(self, data):
+        with self.lock:
+            self.data = data
+            self.dirty = True
+            if self.timer is None:
+                self.timer = threading.Timer(SAVE_DELAY, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.dirty and not self.journal_entries and not self.journal_torn:
+                return
+
+            with self.file_lock:
+                if not self.dirty:
+                    # Plain compaction: pick up other processes' entries first
+                    self.get()
+                    if not self.journal_entries and not self.journal_torn:
+                        return
+                # Write to a temp file first, then swap it in so readers never
+                # see a half-written document. The journal is only cleared once
+                # the snapshot that contains it is in place.
+                tmp_path = CONFIG_FILE + ".tmp"
+                try:
+                    with open(tmp_path, "w") as f:
+                        json.dump(self.data, f, indent=4)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, CONFIG_FILE)
+                    if os.path.exists(_journal_path()):
+                        open(_journal_path(), "w").close()
+                except Exception as e:
+                    print(f"Error saving config: {e}")
+                    return
+
+                self.dirty = False
+                self.journal_entries = 0
+                self.journal_torn = False
+                self.stamp = self._disk_stamp()
+
+    def invalidate(self):
+        with self.lock:
+            if not self.dirty:
+                self.data = None
+                self.stamp = None
+
+
+_cache = _ConfigCache()
+atexit.register(_cache.flush)
+
+_active = None
+_active_lock = threading.Lock()
+
+
+def _store():
+    """
+    The config backend in use: the JSON cache above, or a SqliteConfigStore.
+
+    SQLite is used when APP_MANAGER_CONFIG_BACKEND=sqlite, when config.db
+    already exists, or when config.json sets "config_backend": "sqlite". In
+    the last case config.json is migrated into the database once.
+    APP_MANAGER_CONFIG_BACKEND=json forces the JSON file.
+    """
+    global _active
+    if _active is not None:
+        return _active
+
+    with _active_lock:
+        if _active is not None:
+            return _active
+
+        choice = os.environ.get("APP_MANAGER_CONFIG_BACKEND", "").lower()
+        if not choice:
+            if os.path.exists(CONFIG_DB) or _cache.get().get("config_backend") == "sqlite":
+                choice = "sqlite"
+
+        if choice == "sqlite":
+            from sqlite_store import SqliteConfigStore, migrate_json
+            try:
+                store = SqliteConfigStore(CONFIG_DB)
+                migrate_json(store, _cache, CONFIG_FILE)
+            except Exception as e:
+                print(f"Config database unavailable, using {CONFIG_FILE}: {e}")
+                store = _cache
+            _active = store
+        else:
+            _active = _cache
+        return _active
+
+
+class ConfigManager:
+    @staticmethod
+    def load_config():
+        return _store().get()
 
     @staticmethod
     def save_config(data):
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+        _store().put(data)
+
+    @staticmethod
+    def flush():
+        # Force any pending debounced write to disk now
+        _store().flush()
+
+    @staticmethod
+    def reload():
+        # Drop the cached copy so the next access re-reads config.json
+        _store().invalidate()
 
     @staticmethod
     def get_root_dir():
@@ -27,25 +464,117 @@ class ConfigManager:
 
     @staticmethod
     def set_root_dir(path):
+        _store().mutate(["set", "root_dir", path])
+
+    @staticmethod
+    def get_scan_workers():
+        # Number of threads used to probe project folders (1 = serial scan)
         config = ConfigManager.load_config()
-        config["root_dir"] = path
-        ConfigManager.save_config(config)
+        return config.get("scan_workers", DEFAULT_SCAN_WORKERS)
+
+    @staticmethod
+    def get_scan_roots():
+        # root_dir first, then any extra "scan_roots", without duplicates
+        config = ConfigManager.load_config()
+        roots = []
+        for root in [config.get("root_dir")] + list(config.get("scan_roots", [])):
+            if root and root not in roots:
+                roots.append(root)
+        return roots
+
+    @staticmethod
+    def get_scan_depth():
+        # How many folder levels below a root may hold apps (1 = direct children)
+        config = ConfigManager.load_config()
+        return config.get("scan_depth", DEFAULT_SCAN_DEPTH)
+
+    @staticmethod
+    def get_scan_exclude():
+        # gitignore-style patterns, added to AppScanner.IGNORED_FOLDERS
+        config = ConfigManager.load_config()
+        return config.get("scan_exclude", [])
+
+    @staticmethod
+    def get_scan_max_dirs():
+        config = ConfigManager.load_config()
+        return config.get("scan_max_dirs", DEFAULT_SCAN_MAX_DIRS)
+
+    @staticmethod
+    def get_capture_output():
+        # Launch apps with their output piped into the manager instead of a console
+        config = ConfigManager.load_config()
+        return config.get("capture_output", False)
+
+    @staticmethod
+    def get_log_to_disk():
+        # Also write captured output to rotating files under LOG_DIR
+        config = ConfigManager.load_config()
+        return config.get("log_to_disk", False)
+
+    @staticmethod
+    def get_fast_launch():
+        # Hand python launches to pre-started interpreters (implies captured output)
+        config = ConfigManager.load_config()
+        return config.get("fast_launch", False)
+
+    @staticmethod
+    def get_fast_launch_pool_size():
+        config = ConfigManager.load_config()
+        return config.get("fast_launch_pool_size", 1)
+
+    @staticmethod
+    def get_fast_launch_modules():
+        # None -> warm_pool.DEFAULT_MODULES
+        config = ConfigManager.load_config()
+        return config.get("fast_launch_modules")
+
+    @staticmethod
+    def get_monitor_interval():
+        # Seconds between CPU/RSS samples of running apps; 0 turns monitoring off
+        config = ConfigManager.load_config()
+        return config.get("monitor_interval", 2.0)
+
+    @staticmethod
+    def get_app_tags():
+        # {app path: ["tag", ...]}, searchable from the dashboard
+        config = ConfigManager.load_config()
+        return config.get("app_tags", {})
+
+    @staticmethod
+    def get_app_groups():
+        """
+        Named groups of apps launched together:
+        {"name": {"apps": [path, ...], "max_concurrency": 4,
+                  "depends_on": {path: [path, ...]},
+                  "ready": {path: {"port": 8000, "timeout": 30}}}}
+        A readiness check is either {"port": n} (optionally "host") or
+        {"log": "regex"} matched against the app's captured output.
+        """
+        config = ConfigManager.load_config()
+        return config.get("app_groups", {})
+
+    @staticmethod
+    def set_app_group(name, group):
+        _store().mutate(["set_item", "app_groups", name, group])
+
+    @staticmethod
+    def remove_app_group(name):
+        _store().mutate(["del_item", "app_groups", name])
 
     @staticmethod
     def get_manual_apps():
         config = ConfigManager.load_config()
         return config.get("manual_apps", [])
 
+    @staticmethod
+    def is_manual_app(path):
+        # Indexed lookup in either store; no scan of the manual app list
+        return _store().has_manual_app(path)
+
     @staticmethod
     def add_manual_app(app_data):
-        config = ConfigManager.load_config()
-        if "manual_apps" not in config:
-            config["manual_apps"] = []
-        
-        # Check for duplicates by path
-        if not any(app["path"] == app_data["path"] for app in config["manual_apps"]):
-            config["manual_apps"].append(app_data)
-            ConfigManager.save_config(config)
+        # Duplicates (by path) are ignored
+        _store().mutate(["append", "manual_apps", app_data])
 
     @staticmethod
     def get_app_overrides():
@@ -54,19 +583,11 @@ class ConfigManager:
 
     @staticmethod
     def add_app_override(app_path, new_entry_point):
-        config = ConfigManager.load_config()
-        if "app_overrides" not in config:
-            config["app_overrides"] = {}
-        
-        config["app_overrides"][str(app_path)] = new_entry_point
-        ConfigManager.save_config(config)
+        _store().mutate(["set_item", "app_overrides", str(app_path), new_entry_point])
 
     @staticmethod
     def remove_manual_app(path):
-        config = ConfigManager.load_config()
-        if "manual_apps" in config:
-            config["manual_apps"] = [app for app in config["manual_apps"] if app["path"] != path]
-            ConfigManager.save_config(config)
+        _store().mutate(["remove", "manual_apps", path])
 
     @staticmethod
     def get_ignored_apps():
@@ -75,10 +596,4 @@ class ConfigManager:
 
     @staticmethod
     def add_ignored_app(path):
-        config = ConfigManager.load_config()
-        if "ignored_apps" not in config:
-            config["ignored_apps"] = []
-        
-        if path not in config["ignored_apps"]:
-            config["ignored_apps"].append(path)
-            ConfigManager.save_config(config)
+        _store().mutate(["append", "ignored_apps", path])
@@ -0,0 +1,268 @@
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from app_scanner import AppScanner
+from app_catalog import AppCatalog
+from scan_index import ScanIndex
+
+# How long to keep collecting events after the first one, so a burst of
+# writes (git checkout, editor save) results in a single re-probe.
+SETTLE_DELAY = 0.25
+
+class PollingBackend:
+    """
+    Portable fallback: re-stats the folders a scan would look at (down to
+    the scan depth) every interval and reports, as "/"-separated paths
+    relative to the root, the folders whose presence or mtime changed.
+    """
+
+    def __init__(self, root_dir, roots=(), interval=2.0):
+        self.root_dir = root_dir
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = self._take_snapshot()
+
+    @staticmethod
+    def available():
+        return True
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for rel, path in AppScanner.folders(self.root_dir, roots=self.roots):
+            try:
+                snapshot[rel] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+        return snapshot
+
+    def wait(self, stop_event):
+        # Returns the set of changed folder names, or an empty set on stop
+        while not stop_event.wait(self.interval):
+            current = self._take_snapshot()
+            changed = {
+                name for name in current.keys() | self.snapshot.keys()
+                if current.get(name) != self.snapshot.get(name)
+            }
+            self.snapshot = current
+            if changed:
+                return changed
+        return set()
+
+    def close(self):
+        pass
+
+class InotifyBackend:
+    """
+    Linux backend built on inotify via ctypes. Watches the root for folders
+    appearing/disappearing and every folder a scan would look at (down to
+    the scan depth, not inside apps) for entries being created, deleted or
+    renamed, which is what entry-point detection depends on. Reports the
+    changed folders as "/"-separated paths relative to the root.
+    """
+
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_ISDIR = 0x40000000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_NONBLOCK = 0x00000800
+    IN_CLOEXEC = 0x00080000
+
+    WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root_dir, roots=()):
+        import ctypes
+        import ctypes.util
+
+        self.root_dir = root_dir
+        self.roots = roots
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        # wd -> folder path relative to the root (None for the root itself)
+        self.watches = {}
+        self.root_wd = self._add_watch(root_dir, None)
+        self._watch_tree("")
+
+    @staticmethod
+    def available():
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library("c"))
+            return hasattr(libc, "inotify_init1")
+        except Exception:
+            return False
+
+    def _add_watch(self, path, name):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = name
+        return wd
+
+    def _watch_tree(self, rel):
+        # Watch rel and the folders below it that a scan would visit
+        for child, path in AppScanner.folders(self.root_dir, rel, roots=self.roots):
+            self._add_watch(path, child)
+
+    def _read_events(self):
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(sys.getfilesystemencoding(), "surrogateescape")
+                offset += length
+
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+
+                new_dir = mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO)
+                if wd == self.root_wd:
+                    if not name:
+                        continue
+                    changed.add(name)
+                    # Start watching folders that show up under the root
+                    if new_dir:
+                        self._watch_tree(name)
+                elif self.watches.get(wd):
+                    rel = self.watches[wd]
+                    changed.add(rel)
+                    if new_dir:
+                        # Re-walked from the parent, so nothing gets watched
+                        # inside an app folder
+                        self._watch_tree(rel)
+        return changed
+
+    def wait(self, stop_event):
+        while not stop_event.is_set():
+            ready, _, _ = select.select([self.fd], [], [], 0.5)
+            if not ready:
+                continue
+
+            changed = self._read_events()
+            # Let the burst settle and fold in whatever else arrived
+            time.sleep(SETTLE_DELAY)
+            changed |= self._read_events()
+            if changed:
+                return changed
+        return set()
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+WATCH_BACKENDS = [InotifyBackend, PollingBackend]
+
+def create_backend(root_dir, roots=()):
+    # First available backend wins; polling always works
+    for backend in WATCH_BACKENDS:
+        if backend.available():
+            try:
+                return backend(root_dir, roots)
+            except Exception as e:
+                print(f"Watcher backend {backend.__name__} failed: {e}")
+    return PollingBackend(root_dir, roots)
+
+class FolderWatcher(threading.Thread):
+    """
+    Watches root_dir in the background and reports app-level changes.
+
+    emit(kind, payload) is called from the watcher thread with one of:
+      ("app_added", AppModel), ("app_changed", AppModel), ("app_removed", path),
+      ("app_touched", path) when a folder changed but the app itself didn't
+
+    roots are all the roots being watched. A root nested inside root_dir
+    has its own watcher, so its folders are left out here, as a scan of
+    root_dir leaves them out.
+    """
+
+    def __init__(self, root_dir, apps, emit, backend=None, roots=()):
+        super().__init__(daemon=True)
+        self.root_dir = os.path.normpath(root_dir)
+        self.roots = AppScanner._roots(list(roots) + [self.root_dir])
+        self.emit = emit
+        self.backend = backend
+        self.stop_event = threading.Event()
+
+        # Apps as last reported to the UI, minus those of nested roots
+        self.known = AppCatalog(
+            app for app in apps if AppScanner._root_of(app.path, self.roots) == self.root_dir
+        )
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        if self.backend is None:
+            self.backend = create_backend(self.root_dir, self.roots)
+
+        try:
+            while not self.stop_event.is_set():
+                changed = self.backend.wait(self.stop_event)
+                if changed and not self.stop_event.is_set():
+                    self.process(changed)
+        finally:
+            self.backend.close()
+
+    def process(self, names):
+        index = ScanIndex.shared()
+
+        # A folder that is re-walked covers everything below it
+        names = sorted(names)
+        covered = set()
+        for name in names:
+            if not any(p in covered for p in self._ancestors(name)):
+                covered.add(name)
+
+        for name in sorted(covered):
+            # Re-walk the changed folder; with a scan depth above 1 it can
+            # hold any number of apps
+            path = os.path.join(self.root_dir, name.replace("/", os.sep))
+            prefix = os.path.join(path, "")
+            found = AppCatalog(AppScanner.scan_subtree(self.root_dir, name, index=index, roots=self.roots))
+            before = AppCatalog(
+                app for app in self.known if app.path == path or app.path.startswith(prefix)
+            )
+            added, removed, changed = found.difference(before)
+
+            for app in removed:
+                self.known.remove(app.path)
+                self.emit("app_removed", app.path)
+            for app in added:
+                self.known.add(app)
+                self.emit("app_added", app)
+            for app in changed:
+                self.known.replace(app)
+                self.emit("app_changed", app)
+            if not (added or removed or changed) and path in found:
+                self.emit("app_touched", path)
+
+        index.save()
+
+    @staticmethod
+    def _ancestors(rel):
+        parts = rel.split("/")
+        return ["/".join(parts[:i]) for i in range(1, len(parts))]
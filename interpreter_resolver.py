@@ -0,0 +1,268 @@
+import os
+import re
+import shutil
+import sys
+import threading
+
+try:
+    import tomllib
+except ImportError: # Python < 3.11
+    tomllib = None
+
+from app_scanner import AppScanner
+
+# Files whose contents pin the interpreter; part of the cache stamp
+PIN_FILES = [".python-version", "pyproject.toml"]
+
+# Minor versions tried when a project pins python via .python-version or
+# requires-python and no venv is present
+KNOWN_MINORS = range(14, 5, -1)
+
+class InterpreterResolver:
+    """
+    Works out which python should run an app, and remembers the answer.
+
+    Resolution order:
+    1. A venv in the app folder (venv/.venv/env, Scripts/python.exe on
+       Windows, bin/python elsewhere).
+    2. Any other subfolder that has a pyvenv.cfg.
+    3. A .python-version file (pyenv style).
+    4. requires-python in pyproject.toml.
+    5. The manager's own interpreter (or "python" on PATH when frozen).
+
+    Results are cached per app folder and stamped with the mtimes of the
+    folder and its venv candidates, plus the mtime and size of the version
+    pin files (their edits don't change the folder's mtime).
+    resolve(validate=False) trusts the cache outright, which is what the
+    Launch path uses; prewarm() re-validates in the background after every
+    scan so the cache doesn't go stale.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # app_dir -> (stamp, interpreter)
+        self.cache = {}
+        # command name -> resolved path (or None); PATH doesn't change under us
+        self.which_cache = {}
+
+    @staticmethod
+    def shared():
+        with InterpreterResolver._shared_lock:
+            if InterpreterResolver._shared is None:
+                InterpreterResolver._shared = InterpreterResolver()
+            return InterpreterResolver._shared
+
+    def resolve(self, app_dir, validate=True):
+        with self.lock:
+            cached = self.cache.get(app_dir)
+        if cached is not None and not validate:
+            return cached[1]
+
+        stamp = self.stamp(app_dir)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        interpreter = self.find_interpreter(app_dir)
+        with self.lock:
+            self.cache[app_dir] = (stamp, interpreter)
+        return interpreter
+
+    def invalidate(self, app_dir):
+        with self.lock:
+            self.cache.pop(app_dir, None)
+
+    def prewarm(self, app_dirs):
+        # Resolve (and re-validate) a batch of apps on a background thread
+        app_dirs = list(app_dirs)
+
+        def work():
+            for app_dir in app_dirs:
+                try:
+                    self.resolve(app_dir)
+                except Exception as e:
+                    print(f"Error resolving interpreter for {app_dir}: {e}")
+
+        thread = threading.Thread(target=work, daemon=True)
+        thread.start()
+        return thread
+
+    def stamp(self, app_dir):
+        stamp = []
+        for path in [app_dir] + [os.path.join(app_dir, v) for v in AppScanner.VENV_NAMES]:
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        for name in PIN_FILES:
+            try:
+                st = os.stat(os.path.join(app_dir, name))
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    # --- Resolution steps ---
+
+    def find_interpreter(self, app_dir):
+        for v in AppScanner.VENV_NAMES:
+            candidate = self.venv_python(os.path.join(app_dir, v))
+            if candidate:
+                return candidate
+
+        candidate = self.find_pyvenv_cfg(app_dir)
+        if candidate:
+            return candidate
+
+        candidate = self.from_python_version(app_dir)
+        if candidate:
+            return candidate
+
+        candidate = self.from_requires_python(app_dir)
+        if candidate:
+            return candidate
+
+        return self.default_python()
+
+    @staticmethod
+    def venv_python(venv_dir):
+        if os.name == "nt":
+            layouts = [("Scripts", "python.exe"), ("bin", "python")]
+        else:
+            layouts = [("bin", "python"), ("Scripts", "python.exe")]
+        for folder, exe in layouts:
+            candidate = os.path.join(venv_dir, folder, exe)
+            if os.path.exists(candidate):
+                return candidate
+        return None
+
+    def find_pyvenv_cfg(self, app_dir):
+        # venvs with unusual names still carry a pyvenv.cfg at their root
+        try:
+            with os.scandir(app_dir) as it:
+                dirs = [e.path for e in it if e.name not in AppScanner.VENV_NAMES and e.is_dir()]
+        except OSError:
+            return None
+
+        for d in dirs:
+            if os.path.exists(os.path.join(d, "pyvenv.cfg")):
+                candidate = self.venv_python(d)
+                if candidate:
+                    return candidate
+        return None
+
+    def from_python_version(self, app_dir):
+        path = os.path.join(app_dir, ".python-version")
+        try:
+            with open(path, "r") as f:
+                version = f.readline().strip()
+        except OSError:
+            return None
+        if not version:
+            return None
+
+        # pyenv keeps full installs under $PYENV_ROOT/versions/<version>
+        pyenv_root = os.environ.get("PYENV_ROOT") or os.path.join(os.path.expanduser("~"), ".pyenv")
+        if os.name == "nt":
+            pyenv_python = os.path.join(pyenv_root, "pyenv-win", "versions", version, "python.exe")
+        else:
+            pyenv_python = os.path.join(pyenv_root, "versions", version, "bin", "python")
+        if os.path.exists(pyenv_python):
+            return pyenv_python
+
+        match = re.match(r"(\d+)\.(\d+)", version)
+        if match:
+            return self.which(f"python{match.group(1)}.{match.group(2)}")
+        return None
+
+    def from_requires_python(self, app_dir):
+        spec = self.read_requires_python(os.path.join(app_dir, "pyproject.toml"))
+        if not spec:
+            return None
+
+        # Prefer our own interpreter when it already fits
+        if version_matches(sys.version_info[:3], spec) and not getattr(sys, "frozen", False):
+            return sys.executable
+
+        for minor in KNOWN_MINORS:
+            if version_matches((3, minor, 0), spec):
+                candidate = self.which(f"python3.{minor}")
+                if candidate:
+                    return candidate
+        return None
+
+    @staticmethod
+    def read_requires_python(pyproject_path):
+        try:
+            with open(pyproject_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+
+        if tomllib is not None:
+            try:
+                return tomllib.loads(raw.decode("utf-8")).get("project", {}).get("requires-python")
+            except Exception:
+                return None
+
+        match = re.search(rb'^\s*requires-python\s*=\s*["\']([^"\']+)["\']', raw, re.MULTILINE)
+        return match.group(1).decode("utf-8") if match else None
+
+    def default_python(self):
+        # If running as compiled EXE (frozen), sys.executable is THIS EXE.
+        # We must NOT use it to run scripts. Fallback to global "python".
+        if getattr(sys, "frozen", False):
+            return self.which("python") or "python"
+
+        # Default to system python (development mode)
+        return sys.executable
+
+    def which(self, name):
+        with self.lock:
+            if name in self.which_cache:
+                return self.which_cache[name]
+        found = shutil.which(name)
+        with self.lock:
+            self.which_cache[name] = found
+        return found
+
+def parse_version(text):
+    parts = []
+    for piece in text.strip().split("."):
+        if not piece.isdigit():
+            break
+        parts.append(int(piece))
+    return tuple(parts)
+
+def version_matches(version, spec):
+    """
+    Minimal PEP 440 check for requires-python strings such as ">=3.9",
+    ">=3.8,<3.12" or "~=3.10". Anything unparseable is ignored.
+    """
+    for clause in spec.split(","):
+        match = re.match(r"\s*(~=|==|!=|<=|>=|<|>)\s*([\d.]+)(\.\*)?\s*$", clause)
+        if not match:
+            continue
+        op, text, wildcard = match.groups()
+        target = parse_version(text)
+        current = tuple(version[:len(target)]) if (wildcard or op in ("==", "!=")) else tuple(version)
+
+        if op == ">=" and not current >= target:
+            return False
+        if op == ">" and not current > target:
+            return False
+        if op == "<=" and not current <= target:
+            return False
+        if op == "<" and not current < target:
+            return False
+        if op == "==" and current != target:
+            return False
+        if op == "!=" and current == target:
+            return False
+        if op == "~=":
+            prefix = target[:-1] if len(target) > 1 else target
+            if not (tuple(version) >= target and tuple(version[:len(prefix)]) == prefix):
+                return False
+    return True
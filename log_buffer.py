@@ -0,0 +1,113 @@
+import collections
+import itertools
+import os
+import threading
+
+# Longest chunk read as one line, so output without newlines can't grow a
+# single entry without bound
+MAX_LINE_LENGTH = 64 * 1024
+
+class LogBuffer:
+    """
+    Bounded, line-indexed buffer for a captured process's output.
+
+    Every line gets an absolute number. The buffer keeps at most max_lines
+    lines and max_bytes characters; older lines fall off the front, so
+    readers can tell from the numbers how much they missed. If log_path is
+    set, every line is also appended to disk and the file is rotated once
+    it passes rotate_bytes, keeping `backups` old files.
+    """
+
+    def __init__(self, max_lines=5000, max_bytes=1024 * 1024, log_path=None, rotate_bytes=5 * 1024 * 1024, backups=3):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.lines = collections.deque()
+        self.size = 0
+        # Number of the oldest line still held
+        self.first_line = 0
+        self.lock = threading.Lock()
+
+        self.log_path = log_path
+        self.rotate_bytes = rotate_bytes
+        self.backups = backups
+        self.log_file = None
+        if log_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+                self.log_file = open(log_path, "a", encoding="utf-8")
+            except Exception as e:
+                print(f"Error opening log file: {e}")
+
+    @property
+    def next_line(self):
+        # Number the next appended line will get
+        return self.first_line + len(self.lines)
+
+    def append(self, line):
+        with self.lock:
+            self.lines.append(line)
+            self.size += len(line)
+            while self.lines and (len(self.lines) > self.max_lines or self.size > self.max_bytes):
+                self.size -= len(self.lines.popleft())
+                self.first_line += 1
+
+            if self.log_file is not None:
+                self._write(line)
+
+    def read_since(self, line_no):
+        """
+        Returns (first, lines, next) for everything from line_no onwards.
+
+        first is the number of lines[0]; if it is greater than line_no the
+        lines in between were already dropped. Pass next back in to tail.
+        """
+        with self.lock:
+            start = max(line_no, self.first_line)
+            offset = start - self.first_line
+            lines = list(itertools.islice(self.lines, offset, None))
+            return start, lines, self.next_line
+
+    def _write(self, line):
+        try:
+            self.log_file.write(line + "\n")
+            self.log_file.flush()
+            if self.log_file.tell() >= self.rotate_bytes:
+                self._rotate()
+        except Exception as e:
+            print(f"Error writing log file: {e}")
+            self.log_file = None
+
+    def _rotate(self):
+        self.log_file.close()
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.log_path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.log_path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.log_path, f"{self.log_path}.1")
+        else:
+            os.remove(self.log_path)
+        self.log_file = open(self.log_path, "a", encoding="utf-8")
+
+    def close(self):
+        with self.lock:
+            if self.log_file is not None:
+                self.log_file.close()
+                self.log_file = None
+
+def start_reader(stream, buffer):
+    """Pumps a process's output stream into buffer on a daemon thread."""
+
+    def pump():
+        try:
+            for raw in iter(lambda: stream.readline(MAX_LINE_LENGTH), b""):
+                buffer.append(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+        except Exception as e:
+            buffer.append(f"[log reader stopped: {e}]")
+        finally:
+            stream.close()
+            buffer.close()
+
+    thread = threading.Thread(target=pump, daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,28 @@
+import threading
+
+from config_manager import ConfigManager
+from scan_index import ScanIndex
+from scan_snapshot import load_snapshot
+
+class StartupPreload(threading.Thread):
+    """
+    Reads everything the first paint needs while the UI toolkit is still
+    building widgets: the config, the last scan snapshot and the scan index.
+    join() it before touching the results.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.root_dir = None
+        # AppModels from the last scan of root_dir, or None
+        self.apps = None
+
+    def run(self):
+        try:
+            self.root_dir = ConfigManager.get_root_dir()
+            if self.root_dir:
+                self.apps = load_snapshot(self.root_dir)
+            # The first scan would load this anyway; do it off the UI thread
+            ScanIndex.shared()
+        except Exception as e:
+            print(f"Error preloading startup data: {e}")
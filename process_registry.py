@@ -0,0 +1,141 @@
+import threading
+import time
+
+class ProcessRecord:
+    def __init__(self, app_path, name, popen, backend, log=None):
+        self.app_path = app_path
+        self.name = name
+        self.popen = popen
+        self.backend = backend
+        self.pid = popen.pid
+        self.start_time = time.time()
+        self.exit_code = None
+        # LogBuffer with the captured output, if the app was launched captured
+        self.log = log
+
+    @property
+    def running(self):
+        return self.exit_code is None
+
+    def __repr__(self):
+        state = "running" if self.running else f"exited {self.exit_code}"
+        return f"<ProcessRecord {self.name} pid={self.pid} {state}>"
+
+class ProcessRegistry:
+    """
+    Keeps track of every process launched by the manager.
+
+    A single background reaper polls the tracked processes and reports state
+    changes to subscribers as callback(kind, record), where kind is
+    "started" or "exited". Callbacks run on the caller's or the reaper's
+    thread, so UI subscribers should hand them off to their own queue.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, poll_interval=0.25):
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        # app path -> most recent ProcessRecord for that app
+        self.records = {}
+        self.listeners = []
+        self.wakeup = threading.Event()
+        self.reaper = None
+
+    @staticmethod
+    def shared():
+        with ProcessRegistry._shared_lock:
+            if ProcessRegistry._shared is None:
+                ProcessRegistry._shared = ProcessRegistry()
+            return ProcessRegistry._shared
+
+    def subscribe(self, callback):
+        with self.lock:
+            self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            if callback in self.listeners:
+                self.listeners.remove(callback)
+
+    def _emit(self, kind, record):
+        with self.lock:
+            listeners = list(self.listeners)
+        for callback in listeners:
+            try:
+                callback(kind, record)
+            except Exception as e:
+                print(f"Process listener failed: {e}")
+
+    def register(self, app_model, popen, backend, log=None):
+        record = ProcessRecord(app_model.path, app_model.name, popen, backend, log)
+        with self.lock:
+            self.records[record.app_path] = record
+            if self.reaper is None or not self.reaper.is_alive():
+                self.reaper = threading.Thread(target=self._reap, daemon=True)
+                self.reaper.start()
+        self.wakeup.set()
+        self._emit("started", record)
+        return record
+
+    def get(self, app_path):
+        # Running record for an app, or None
+        with self.lock:
+            record = self.records.get(app_path)
+        if record is not None and record.running:
+            return record
+        return None
+
+    def latest(self, app_path):
+        # Most recent record for an app, running or not
+        with self.lock:
+            return self.records.get(app_path)
+
+    def is_running(self, app_path):
+        return self.get(app_path) is not None
+
+    def running(self):
+        with self.lock:
+            return [r for r in self.records.values() if r.running]
+
+    def all(self):
+        with self.lock:
+            return list(self.records.values())
+
+    def stop(self, app_path):
+        record = self.get(app_path)
+        if record is None:
+            return False
+        try:
+            record.backend.terminate(record.popen)
+        except Exception as e:
+            print(f"Error stopping {record.name}: {e}")
+            return False
+        self.wakeup.set()
+        return True
+
+    def _reap(self):
+        # Poll until nothing is left running, then let the thread end;
+        # register() starts a new one when needed
+        while True:
+            exited = []
+            with self.lock:
+                running = [r for r in self.records.values() if r.running]
+                for record in running:
+                    code = record.popen.poll()
+                    if code is not None:
+                        record.exit_code = code
+                        exited.append(record)
+                done = len(exited) == len(running)
+                if done:
+                    self.reaper = None
+
+            for record in exited:
+                self._emit("exited", record)
+
+            if done:
+                return
+
+            self.wakeup.wait(self.poll_interval)
+            self.wakeup.clear()
@@ -1,59 +1,259 @@
 
+import contextlib
 import os
+import re
+import signal
+import socket
 import subprocess
-import sys
-import ctypes
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config_manager import ConfigManager, LOG_DIR
+from process_registry import ProcessRegistry
+from log_buffer import LogBuffer, start_reader
+from interpreter_resolver import InterpreterResolver
+from warm_pool import WarmPool
+
+class WindowsConsoleBackend:
+    """Launches apps in a new cmd.exe console (the original behaviour)."""
+
+    # output (detached launches) is unused here: a new console has its own streams
+
+    @staticmethod
+    def launch_python(interpreter, script, cwd, capture=False, output=None):
+        if capture:
+            return ProcessRunner.run_captured(
+                [os.path.normpath(interpreter), os.path.normpath(script)],
+                cwd,
+                creationflags=subprocess.CREATE_NO_WINDOW
+            )
+        return ProcessRunner.run_normal(interpreter, script, cwd)
+
+    @staticmethod
+    def launch_batch(script, cwd, capture=False, output=None):
+        if capture:
+            return ProcessRunner.run_captured(
+                ["cmd.exe", "/c", os.path.normpath(script)],
+                cwd,
+                creationflags=subprocess.CREATE_NO_WINDOW
+            )
+        return ProcessRunner.run_batch(script, cwd)
+
+    @staticmethod
+    def terminate(popen):
+        # Kill the console and everything started from it
+        subprocess.Popen(
+            ["taskkill", "/T", "/F", "/PID", str(popen.pid)],
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+
+class PosixBackend:
+    """Launches apps as plain child processes in their own session."""
+
+    @staticmethod
+    def launch_python(interpreter, script, cwd, capture=False, output=None):
+        if capture:
+            return ProcessRunner.run_captured([interpreter, script], cwd, start_new_session=True)
+        try:
+            return subprocess.Popen(
+                [interpreter, script], cwd=cwd, start_new_session=True, **ProcessRunner.redirect(output)
+            )
+        except Exception as e:
+            print(f"Error running app: {e}")
+            return None
+
+    @staticmethod
+    def launch_batch(script, cwd, capture=False, output=None):
+        if capture:
+            return ProcessRunner.run_captured(["/bin/sh", script], cwd, start_new_session=True)
+        try:
+            return subprocess.Popen(
+                ["/bin/sh", script], cwd=cwd, start_new_session=True, **ProcessRunner.redirect(output)
+            )
+        except Exception as e:
+            print(f"Error running batch: {e}")
+            return None
+
+    @staticmethod
+    def terminate(popen):
+        # The app leads its own process group, so this also reaches its children
+        try:
+            os.killpg(popen.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
 
 class ProcessRunner:
     @staticmethod
-    def run_app(app_model, as_admin=False):
+    def backend():
+        return WindowsConsoleBackend if os.name == "nt" else PosixBackend
+
+    @staticmethod
+    def run_app(app_model, as_admin=False, capture=None, fast=None, detached=False):
         """
         Runs the application.
         Strategies:
         1. Check extension. If .bat/.cmd, run directly.
-        2. Detect venv in app directory.
-        3. If venv, use venv/Scripts/python.exe.
-        4. Else, use system python (sys.executable).
+        2. Resolve the interpreter (venv, pyvenv.cfg, .python-version,
+           requires-python) through the cached InterpreterResolver.
+        3. Else, use system python (sys.executable).
         
-        It opens a NEW console window so the user can interact/see output.
+        On Windows it opens a NEW console window so the user can interact/see output.
+
+        Normal launches are tracked in the ProcessRegistry and the record is
+        returned; launching an app that is already running returns the
+        existing record instead of starting a second copy. Admin launches go
+        through ShellExecute, which hands back no process, so they are not
+        tracked and return None.
+
+        With capture (default: the "capture_output" setting) the app runs
+        without a console and its stdout/stderr are read into a bounded
+        LogBuffer on the record, optionally mirrored to rotating log files.
+
+        With fast (default: the "fast_launch" setting) python apps are handed
+        to a pre-started interpreter from the WarmPool when one is ready for
+        the resolved venv. Warm workers have no console, so fast launches are
+        always captured. Without a ready worker it is a normal cold launch.
+
+        With detached the app must not hold on to our stdin/stdout/stderr
+        (the CLI exits long before its apps do, and its stdout may be a
+        pipe): it reads from the null device and its output is appended to
+        its file under LOG_DIR. Detached launches are never captured or fast.
         """
-        
+        registry = ProcessRegistry.shared()
+        if not as_admin:
+            existing = registry.get(app_model.path)
+            if existing is not None:
+                print(f"{app_model.name} is already running (PID {existing.pid})")
+                return existing
+
+        if detached:
+            capture = fast = False
+        if capture is None:
+            capture = ConfigManager.get_capture_output()
+        if fast is None:
+            fast = ConfigManager.get_fast_launch()
+
         target_dir = app_model.path
         entry_point = app_model.entry_point
         script_path = os.path.join(target_dir, entry_point)
+        backend = ProcessRunner.backend()
         
         # Check for batch file
         ext = os.path.splitext(entry_point)[1].lower()
         if ext in [".bat", ".cmd"]:
             if as_admin:
                 ProcessRunner.run_batch_as_admin(script_path, target_dir)
-            else:
-                ProcessRunner.run_batch(script_path, target_dir)
+                return None
+            with ProcessRunner.open_output(app_model, detached) as output:
+                popen = backend.launch_batch(script_path, target_dir, capture=capture, output=output)
+        else:
+            python_exe = ProcessRunner.detect_python(target_dir)
+
+            if as_admin:
+                ProcessRunner.run_as_admin(python_exe, script_path, target_dir)
+                return None
+
+            popen = None
+            if fast:
+                worker = WarmPool.shared().acquire(python_exe)
+                if worker is not None:
+                    popen = worker.start(script_path, target_dir)
+                    capture = True
+            if popen is None:
+                with ProcessRunner.open_output(app_model, detached) as output:
+                    popen = backend.launch_python(
+                        python_exe, script_path, target_dir, capture=capture, output=output
+                    )
+
+        if popen is None:
+            return None
+
+        log = None
+        if capture:
+            log = ProcessRunner.create_log(app_model)
+            start_reader(popen.stdout, log)
+        return registry.register(app_model, popen, backend, log=log)
+
+    @staticmethod
+    def log_path(app_model):
+        safe_name = re.sub(r"[^\w.-]", "_", app_model.name)
+        return os.path.join(LOG_DIR, f"{safe_name}.log")
+
+    @staticmethod
+    def create_log(app_model):
+        log_path = ProcessRunner.log_path(app_model) if ConfigManager.get_log_to_disk() else None
+        return LogBuffer(log_path=log_path)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def open_output(app_model, detached):
+        # The file a detached app writes to; the child keeps its own handle,
+        # so ours is closed once it has started
+        if not detached:
+            yield None
             return
+        path = ProcessRunner.log_path(app_model)
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            output = open(path, "ab")
+        except OSError as e:
+            print(f"Error opening {path}: {e}")
+            output = open(os.devnull, "wb")
+        with output:
+            yield output
 
-        python_exe = ProcessRunner.detect_python(target_dir)
+    @staticmethod
+    def redirect(output):
+        # Popen arguments for a plain launch: inherit our streams, or detach
+        if output is None:
+            return {}
+        return {"stdin": subprocess.DEVNULL, "stdout": output, "stderr": subprocess.STDOUT}
 
-        if as_admin:
-            ProcessRunner.run_as_admin(python_exe, script_path, target_dir)
-        else:
-            ProcessRunner.run_normal(python_exe, script_path, target_dir)
+    @staticmethod
+    def run_captured(args, cwd, creationflags=0, start_new_session=False):
+        # Output goes to a pipe read by the manager; unbuffered so it streams
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        try:
+            return subprocess.Popen(
+                args,
+                cwd=cwd,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                creationflags=creationflags,
+                start_new_session=start_new_session
+            )
+        except Exception as e:
+            print(f"Error running app: {e}")
+            return None
+
+    @staticmethod
+    def stop_app(app_model):
+        return ProcessRegistry.shared().stop(app_model.path)
+
+    @staticmethod
+    def launch_group(name, apps_by_path, emit=None):
+        """
+        Starts the app group `name` from ConfigManager in the background.
+
+        apps_by_path maps paths to AppModels (the group only stores paths).
+        Returns the LaunchScheduler; see it for the events passed to emit.
+        """
+        group = ConfigManager.get_app_groups().get(name)
+        if group is None:
+            raise KeyError(f"Unknown app group: {name}")
+
+        scheduler = LaunchScheduler(name, group, apps_by_path, emit)
+        scheduler.start()
+        return scheduler
 
     @staticmethod
     def detect_python(app_dir):
-        # Check common venv names
-        venvs = ["venv", ".venv", "env"]
-        for v in venvs:
-            candidate = os.path.join(app_dir, v, "Scripts", "python.exe")
-            if os.path.exists(candidate):
-                return candidate
-        
-        # If running as compiled EXE (frozen), sys.executable is THIS EXE.
-        # We must NOT use it to run scripts. Fallback to global "python".
-        if getattr(sys, 'frozen', False):
-            return "python"
-            
-        # Default to system python (development mode)
-        return sys.executable
+        # Served from the resolver's cache when the app was pre-resolved after
+        # a scan, so launching doesn't touch the filesystem
+        return InterpreterResolver.shared().resolve(app_dir, validate=False)
 
     @staticmethod
     def run_normal(interpreter, script, cwd):
@@ -79,13 +279,14 @@ class ProcessRunner:
         full_cmd = f'cmd.exe /k "{command_to_run}"'
         
         try:
-            subprocess.Popen(
+            return subprocess.Popen(
                 full_cmd, 
                 cwd=cwd, 
                 creationflags=subprocess.CREATE_NEW_CONSOLE
             )
         except Exception as e:
             print(f"Error running app: {e}")
+            return None
 
     @staticmethod
     def run_as_admin(interpreter, script, cwd):
@@ -107,6 +308,7 @@ class ProcessRunner:
             
             params = f'/k "{command_to_run}"'
             
+            import ctypes
             ctypes.windll.shell32.ShellExecuteW(
                 None, 
                 "runas", 
@@ -134,13 +336,14 @@ class ProcessRunner:
         full_cmd = f'cmd.exe /k "{command_to_run}"'
         
         try:
-            subprocess.Popen(
+            return subprocess.Popen(
                 full_cmd, 
                 cwd=cwd, 
                 creationflags=subprocess.CREATE_NEW_CONSOLE
             )
         except Exception as e:
             print(f"Error running batch: {e}")
+            return None
 
     @staticmethod
     def run_batch_as_admin(script, cwd):
@@ -157,6 +360,7 @@ class ProcessRunner:
             
             params = f'/k "{command_to_run}"'
             
+            import ctypes
             ctypes.windll.shell32.ShellExecuteW(
                 None, 
                 "runas", 
@@ -183,3 +387,137 @@ class ProcessRunner:
             os.startfile(path)
         except Exception as e:
             print(f"Error opening editor: {e}")
+
+class LaunchScheduler:
+    """
+    Starts a group of apps with a concurrency limit and dependency ordering.
+
+    An app is only launched once everything in its depends_on list is ready.
+    "Ready" means its readiness check passed: a TCP port accepting
+    connections, a regex showing up in its captured output, or, with no
+    check configured, simply that the process started. If a dependency
+    fails, its dependents are skipped. Dependencies that aren't listed in
+    the group's apps are started too.
+
+    Progress goes to emit(kind, payload) from worker threads:
+      ("group_app", (group, path, state))  state: starting/ready/failed/skipped
+      ("group_done", (group, {path: state}))
+    """
+
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_TIMEOUT = 30
+
+    def __init__(self, name, group, apps_by_path, emit=None):
+        self.name = name
+        self.apps = list(group.get("apps", []))
+        self.max_concurrency = max(1, group.get("max_concurrency", self.DEFAULT_CONCURRENCY))
+        self.depends_on = group.get("depends_on", {})
+        self.ready_checks = group.get("ready", {})
+        self.apps_by_path = apps_by_path
+        self.emit = emit or (lambda kind, payload: None)
+
+        self.order = self.topological_order()
+        self.done = {path: threading.Event() for path in self.order}
+        self.states = {}
+        self.thread = None
+
+    def topological_order(self):
+        # Dependencies first; raises ValueError on cycles
+        order = []
+        visiting = set()
+        visited = set()
+
+        def visit(path):
+            if path in visited:
+                return
+            if path in visiting:
+                raise ValueError(f"Dependency cycle in group {self.name} at {path}")
+            visiting.add(path)
+            for dep in self.depends_on.get(path, []):
+                visit(dep)
+            visiting.discard(path)
+            visited.add(path)
+            order.append(path)
+
+        for path in self.apps:
+            visit(path)
+        return order
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        # Tasks are queued dependencies-first, so by the time a task gets a
+        # worker every dependency has already been picked up; waiting on them
+        # can't starve the pool.
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            for path in self.order:
+                pool.submit(self.launch_one, path)
+        self.emit("group_done", (self.name, dict(self.states)))
+
+    def set_state(self, path, state):
+        self.states[path] = state
+        self.emit("group_app", (self.name, path, state))
+        if state in ("ready", "failed", "skipped"):
+            self.done[path].set()
+
+    def launch_one(self, path):
+        try:
+            for dep in self.depends_on.get(path, []):
+                self.done[dep].wait()
+                if self.states.get(dep) != "ready":
+                    self.set_state(path, "skipped")
+                    return
+
+            app_model = self.apps_by_path.get(path)
+            if app_model is None:
+                print(f"[{self.name}] Unknown app: {path}")
+                self.set_state(path, "failed")
+                return
+
+            self.set_state(path, "starting")
+            check = self.ready_checks.get(path, {})
+            # A log check needs the output piped back to us
+            record = ProcessRunner.run_app(app_model, capture=True if "log" in check else None)
+            if record is None:
+                self.set_state(path, "failed")
+                return
+
+            self.set_state(path, "ready" if self.wait_ready(record, check) else "failed")
+        except Exception as e:
+            print(f"[{self.name}] Error launching {path}: {e}")
+            self.set_state(path, "failed")
+
+    def wait_ready(self, record, check):
+        timeout = check.get("timeout", self.DEFAULT_TIMEOUT)
+        deadline = time.monotonic() + timeout
+
+        if "port" in check:
+            host = check.get("host", "127.0.0.1")
+            while time.monotonic() < deadline:
+                if not record.running:
+                    return False
+                try:
+                    with socket.create_connection((host, check["port"]), timeout=0.5):
+                        return True
+                except OSError:
+                    time.sleep(0.2)
+            return False
+
+        if "log" in check:
+            if record.log is None:
+                return False
+            pattern = re.compile(check["log"])
+            next_line = 0
+            while time.monotonic() < deadline:
+                _, lines, next_line = record.log.read_since(next_line)
+                if any(pattern.search(line) for line in lines):
+                    return True
+                if not record.running:
+                    return False
+                time.sleep(0.1)
+            return False
+
+        # No check: started is good enough
+        return record.running or record.exit_code == 0
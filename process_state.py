@@ -0,0 +1,191 @@
+import json
+import os
+import sys
+import threading
+import time
+
+from config_manager import PROCESS_STATE_FILE, _FileLock
+
+# Slack when comparing start times; /proc reports them in clock ticks
+START_TIME_TOLERANCE = 1.0
+
+def pid_alive(pid):
+    if os.name == "nt":
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+                return False
+            return code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, but belongs to someone else
+        return True
+    except OSError:
+        return False
+    return True
+
+def process_start_time(pid):
+    """
+    When the OS says pid was started, in epoch seconds, or None if that
+    can't be determined here. Together with the pid this identifies a
+    process; a recycled pid gets a different start time.
+    """
+    try:
+        import psutil
+        return psutil.Process(pid).create_time()
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    if sys.platform.startswith("linux"):
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+            with open("/proc/stat", "rb") as f:
+                btime = next(int(line.split()[1]) for line in f if line.startswith(b"btime "))
+        except (OSError, StopIteration, ValueError):
+            return None
+        # Field 22, counted after the parenthesised command name
+        ticks = int(stat[stat.rindex(b")") + 2:].split()[19])
+        return btime + ticks / os.sysconf("SC_CLK_TCK")
+
+    if os.name == "nt":
+        import ctypes
+        from ctypes import wintypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            times = [wintypes.FILETIME() for _ in range(4)]
+            if not kernel32.GetProcessTimes(handle, *[ctypes.byref(t) for t in times]):
+                return None
+            created = (times[0].dwHighDateTime << 32) | times[0].dwLowDateTime
+            # FILETIME counts 100 ns steps since 1601
+            return created / 1e7 - 11644473600
+        finally:
+            kernel32.CloseHandle(handle)
+    return None
+
+def is_same_process(entry):
+    """
+    True if the process recorded in entry is still running: the pid exists
+    and, where the start time can be read, it matches the recorded one.
+    """
+    pid = entry.get("pid", 0)
+    if not pid_alive(pid):
+        return False
+    actual = process_start_time(pid)
+    if actual is None:
+        return True
+    recorded = entry.get("created")
+    if recorded is None:
+        # Older entry: the process must at least predate the record; a
+        # recycled pid was started after it
+        return actual <= entry.get("start_time", 0) + START_TIME_TOLERANCE
+    return abs(actual - recorded) <= START_TIME_TOLERANCE
+
+class ProcessStateFile:
+    """
+    Apps launched by any manager process (the GUI or the CLI), by path, in
+    processes.json under the config dir. The ProcessRegistry only knows the
+    processes its own process started; this file lets another one report on
+    and stop them later.
+
+    Entries are {"name", "pid", "start_time", "created"}, where created is
+    the OS start time of the pid. Entries whose pid is gone, or now belongs
+    to a different process (pid reuse, a reboot), are dropped when the file
+    is read, so a crashed manager leaves nothing stale behind.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=PROCESS_STATE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file_lock = _FileLock(lambda: self.path + ".lock")
+
+    @staticmethod
+    def shared():
+        with ProcessStateFile._shared_lock:
+            if ProcessStateFile._shared is None:
+                ProcessStateFile._shared = ProcessStateFile()
+            return ProcessStateFile._shared
+
+    def attach(self, registry):
+        # Mirror launches and exits seen by an in-process registry
+        registry.subscribe(self.on_process_event)
+
+    def on_process_event(self, kind, record):
+        if kind == "started":
+            self.add(record.app_path, record.name, record.pid, record.start_time)
+        elif kind == "exited":
+            self.remove(record.app_path, record.pid)
+
+    def _read(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, data):
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving process state: {e}")
+
+    def _update(self, change):
+        with self.lock, self.file_lock:
+            data = self._read()
+            before = dict(data)
+            change(data)
+            live = {path: entry for path, entry in data.items() if is_same_process(entry)}
+            if live != before:
+                self._write(live)
+            return live
+
+    def add(self, app_path, name, pid, start_time=None):
+        def change(data):
+            data[app_path] = {
+                "name": name,
+                "pid": pid,
+                "start_time": start_time or time.time(),
+                "created": process_start_time(pid)
+            }
+        self._update(change)
+
+    def remove(self, app_path, pid=None):
+        def change(data):
+            entry = data.get(app_path)
+            # Don't drop a newer launch of the same app
+            if entry is not None and (pid is None or entry.get("pid") == pid):
+                del data[app_path]
+        self._update(change)
+
+    def entries(self):
+        # {app_path: entry} for processes that are still alive
+        return self._update(lambda data: None)
+
+    def get(self, app_path):
+        return self.entries().get(app_path)
@@ -0,0 +1,180 @@
+import os
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEFAULT_INTERVAL = 2.0
+
+class ProcfsBackend:
+    """
+    Reads /proc directly (Linux).
+
+    Each sample() walks /proc once, regardless of how many apps are being
+    monitored, and sums every root's whole process tree from that walk.
+    """
+
+    def __init__(self):
+        self.ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self.page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+    @staticmethod
+    def available():
+        return os.path.exists("/proc/self/stat")
+
+    def read_stat(self, pid):
+        # -> (ppid, cpu seconds, rss bytes), or None if the process is gone
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        # The command name may contain spaces and parens; fields start after the last ')'
+        fields = raw[raw.rfind(b")") + 2:].split()
+        try:
+            ppid = int(fields[1])
+            cpu = (int(fields[11]) + int(fields[12])) / self.ticks
+            rss = int(fields[21]) * self.page_size
+        except (IndexError, ValueError):
+            return None
+        return ppid, cpu, rss
+
+    def sample(self, pids):
+        """Returns {pid: (cpu seconds, rss bytes)} summed over each pid's tree."""
+        stats = {}
+        children = {}
+        try:
+            names = os.listdir("/proc")
+        except OSError:
+            return {}
+        for name in names:
+            if not name.isdigit():
+                continue
+            stat = self.read_stat(name)
+            if stat is None:
+                continue
+            pid = int(name)
+            stats[pid] = stat
+            children.setdefault(stat[0], []).append(pid)
+
+        result = {}
+        for root in pids:
+            if root not in stats:
+                continue
+            cpu = rss = 0
+            stack = [root]
+            while stack:
+                pid = stack.pop()
+                stat = stats.get(pid)
+                if stat is None:
+                    continue
+                cpu += stat[1]
+                rss += stat[2]
+                stack.extend(children.get(pid, ()))
+            result[root] = (cpu, rss)
+        return result
+
+class PsutilBackend:
+    """Uses psutil where it is installed (Windows, macOS)."""
+
+    @staticmethod
+    def available():
+        return psutil is not None
+
+    def sample(self, pids):
+        result = {}
+        for root in pids:
+            try:
+                proc = psutil.Process(root)
+                tree = [proc] + proc.children(recursive=True)
+            except psutil.Error:
+                continue
+
+            cpu = rss = 0
+            for p in tree:
+                try:
+                    times = p.cpu_times()
+                    cpu += times.user + times.system
+                    rss += p.memory_info().rss
+                except psutil.Error:
+                    pass
+            result[root] = (cpu, rss)
+        return result
+
+MONITOR_BACKENDS = [ProcfsBackend, PsutilBackend]
+
+def create_backend():
+    # First backend that works on this platform, or None (monitoring off)
+    for backend_cls in MONITOR_BACKENDS:
+        if backend_cls.available():
+            return backend_cls()
+    return None
+
+class ResourceMonitor(threading.Thread):
+    """
+    Samples CPU%, RSS and uptime of every running app in the registry.
+
+    One thread serves all apps. Every `interval` seconds it emits a single
+    emit("metrics", {app_path: (cpu_percent, rss_bytes, uptime_seconds)})
+    covering each running app and its children, so the UI gets one message
+    per tick no matter how many apps are up. CPU% is relative to one core,
+    like top.
+    """
+
+    def __init__(self, registry, emit, interval=DEFAULT_INTERVAL, backend=None):
+        super().__init__(daemon=True)
+        self.registry = registry
+        self.emit = emit
+        self.interval = interval
+        self.backend = backend if backend is not None else create_backend()
+        self.stop_event = threading.Event()
+        # pid -> (cpu seconds, monotonic time) from the previous tick
+        self.previous = {}
+        self.published = False
+
+    def run(self):
+        if self.backend is None:
+            return
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"Resource monitor error: {e}")
+
+    def tick(self):
+        records = self.registry.running()
+        if not records:
+            # Publish the empty set once so stale numbers get cleared
+            if self.published:
+                self.previous.clear()
+                self.published = False
+                self.emit("metrics", {})
+            return
+
+        now = time.monotonic()
+        wall = time.time()
+        samples = self.backend.sample([r.pid for r in records])
+
+        metrics = {}
+        previous = {}
+        for record in records:
+            sample = samples.get(record.pid)
+            if sample is None:
+                continue
+            cpu_time, rss = sample
+            cpu_percent = 0.0
+            last = self.previous.get(record.pid)
+            if last is not None and now > last[1]:
+                cpu_percent = max(0.0, (cpu_time - last[0]) / (now - last[1]) * 100)
+            previous[record.pid] = (cpu_time, now)
+            metrics[record.app_path] = (cpu_percent, rss, wall - record.start_time)
+
+        self.previous = previous
+        self.published = True
+        self.emit("metrics", metrics)
+
+    def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,90 @@
+import os
+import re
+
+class ExcludeRules:
+    """
+    gitignore-style folder exclusions, compiled once per scan.
+
+    Paths are matched relative to the scan root with "/" separators:
+      name        matches a folder called name at any depth
+      a/b         anchored to the root (any pattern containing a slash)
+      /name       anchored to the root
+      *, ?, [..]  wildcards within one path segment
+      **          any number of segments
+      !pattern    re-includes a folder excluded by an earlier pattern
+    A trailing slash is accepted and ignored, since only folders are tested.
+    """
+
+    def __init__(self, patterns):
+        self.rules = []
+        for raw in patterns:
+            pattern = raw.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            negate = pattern.startswith("!")
+            if negate:
+                pattern = pattern[1:]
+            pattern = pattern.rstrip("/")
+            if not pattern:
+                continue
+            self.rules.append((self.compile(pattern), negate))
+
+        # Without negations the whole rule set collapses into one regex
+        self.combined = None
+        if self.rules and not any(negate for _, negate in self.rules):
+            flags = re.IGNORECASE if os.name == "nt" else 0
+            self.combined = re.compile("|".join(f"(?:{r.pattern})" for r, _ in self.rules), flags)
+
+    @staticmethod
+    def compile(pattern):
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+
+        out = []
+        i = 0
+        while i < len(pattern):
+            c = pattern[i]
+            if pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern.startswith("/**", i) and i + 3 == len(pattern):
+                out.append("(?:/.*)?")
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            if c == "*":
+                out.append("[^/]*")
+            elif c == "?":
+                out.append("[^/]")
+            elif c == "[":
+                end = pattern.find("]", i + 1)
+                if end == -1:
+                    out.append(re.escape(c))
+                else:
+                    body = pattern[i + 1:end]
+                    if body.startswith("!"):
+                        body = "^" + body[1:]
+                    out.append(f"[{body}]")
+                    i = end
+            else:
+                out.append(re.escape(c))
+            i += 1
+
+        body = "".join(out)
+        prefix = "^" if anchored else "^(?:.*/)?"
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        return re.compile(f"{prefix}{body}$", flags)
+
+    def excluded(self, rel_path):
+        if self.combined is not None:
+            return self.combined.match(rel_path) is not None
+
+        result = False
+        for regex, negate in self.rules:
+            if regex.match(rel_path):
+                result = not negate
+        return result
@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+
+from config_manager import SCAN_CACHE_FILE
+
+INDEX_VERSION = 1
+
+class ScanIndex:
+    """
+    Persistent record of what the scanner found in each project folder.
+
+    Entries are keyed by folder path and stamped with the folder's mtime.
+    A folder's mtime changes whenever a file or directory inside it is
+    created, removed or renamed, which is everything entry-point detection
+    looks at. So an entry with a matching mtime can be reused without
+    listing the folder again.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=SCAN_CACHE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    @staticmethod
+    def shared():
+        with ScanIndex._shared_lock:
+            if ScanIndex._shared is None:
+                ScanIndex._shared = ScanIndex()
+            return ScanIndex._shared
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable scan cache: {e}")
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            # Copy under the lock; writers may add entries while this dumps
+            data = {"version": INDEX_VERSION, "entries": dict(self.entries)}
+            self.dirty = False
+
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Error saving scan cache: {e}")
+
+    def get(self, path, mtime):
+        # Returns the cached (entry_point, app_type, venv) if still current
+        entry = self.entries.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            return None
+        return entry["entry_point"], entry["app_type"], entry["venv"]
+
+    def get_subdirs(self, path, mtime):
+        # Cached subfolder names of a folder that isn't an app, if still current
+        entry = self.entries.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            return None
+        return entry.get("subdirs")
+
+    def put(self, path, mtime, entry_point, app_type, venv, subdirs=None):
+        with self.lock:
+            self.entries[path] = {
+                "mtime": mtime,
+                "entry_point": entry_point,
+                "app_type": app_type,
+                "venv": venv
+            }
+            # Only recorded for folders the recursive scan descends into
+            if subdirs is not None:
+                self.entries[path]["subdirs"] = subdirs
+            self.dirty = True
+
+    def retain(self, root_dir, seen):
+        # Drop entries under root_dir for folders that no longer exist
+        prefix = os.path.join(root_dir, "")
+        with self.lock:
+            stale = [p for p in self.entries if p.startswith(prefix) and p not in seen]
+            for p in stale:
+                del self.entries[p]
+            if stale:
+                self.dirty = True
@@ -0,0 +1,41 @@
+import json
+import os
+
+from config_manager import SCAN_SNAPSHOT_FILE
+from app_model import AppModel
+
+SNAPSHOT_VERSION = 1
+
+def save_snapshot(root_dir, apps, path=SCAN_SNAPSHOT_FILE):
+    """Remembers the result of the last full scan, for the next startup."""
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "root_dir": root_dir,
+        "apps": [[a.name, a.path, a.entry_point, a.app_type, a.venv] for a in apps]
+    }
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error saving scan snapshot: {e}")
+
+def load_snapshot(root_dir, path=SCAN_SNAPSHOT_FILE):
+    """
+    Apps found by the last scan of root_dir, or None if there is no usable
+    snapshot. The list may be stale; it is only meant to fill the first
+    paint until a fresh scan reconciles it.
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("version") != SNAPSHOT_VERSION or data.get("root_dir") != root_dir:
+        return None
+    try:
+        return [AppModel(*row) for row in data.get("apps", [])]
+    except TypeError:
+        return None
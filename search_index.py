@@ -0,0 +1,207 @@
+import bisect
+import re
+
+_SPLIT = re.compile(r"[^0-9a-z]+")
+
+# Match quality, lower is better
+NAME_PREFIX = 0
+TOKEN_PREFIX = 1
+FUZZY = 2
+
+# Fuzzy matching only kicks in for terms with fewer prefix matches than this
+FUZZY_THRESHOLD = 50
+
+class SearchIndex:
+    """
+    In-memory search over app name, path, entry point and tags.
+
+    Every app is broken into lowercase tokens kept in a sorted list, so the
+    apps matching a prefix are found with a bisect instead of a full scan.
+    When a term has few prefix matches, apps whose name or entry point
+    contains it as a subsequence ("fuzzy") match too. A per-character index
+    narrows those candidates with set intersections before any string is
+    examined. Each further term narrows the result.
+
+    Results of the previous query are kept. While the user keeps typing, the
+    new query only extends the old one, so only the previous hits have to
+    be checked again.
+    """
+
+    def __init__(self):
+        # path -> (name, tokens, fuzzy text)
+        self.docs = {}
+        # token -> set of paths
+        self.postings = {}
+        # Unique tokens in sorted order, for prefix lookups
+        self.tokens = []
+        # character -> set of paths whose fuzzy text contains it
+        self.chars = {}
+        # Sorted (name, path) pairs, for ranking name-prefix matches first
+        self.names = []
+        # (query, {path: score}) of the last search
+        self.last = None
+
+    @staticmethod
+    def tokenize(app, tags=()):
+        name = app.name.lower()
+        parts = [name, app.entry_point.lower()]
+        parts.extend(p.lower() for p in app.path.replace("\\", "/").split("/")[-3:])
+        parts.extend(t.lower() for t in tags)
+
+        tokens = set(p for p in parts if p)
+        for part in parts:
+            tokens.update(t for t in _SPLIT.split(part) if t)
+        return name, tokens, f"{name} {app.entry_point.lower()}"
+
+    def add(self, app, tags=()):
+        # Single update: keep the sorted lists sorted with insort
+        for token in self._index(app, tags):
+            bisect.insort(self.tokens, token)
+        bisect.insort(self.names, (self.docs[app.path][0], app.path))
+        self.last = None
+
+    def extend(self, apps, tags=None):
+        """
+        Bulk add. The sorted lists are appended to and sorted once at the
+        end, instead of an insort per token, which is quadratic in bulk.
+        """
+        tags = tags or {}
+        new_tokens = []
+        new_names = []
+        for app in apps:
+            new_tokens.extend(self._index(app, tags.get(app.path, ())))
+            new_names.append((self.docs[app.path][0], app.path))
+        # An app listed twice was removed and re-added within the batch;
+        # drop what that removal orphaned
+        if new_tokens:
+            self.tokens.extend(t for t in set(new_tokens) if t in self.postings)
+            self.tokens.sort()
+        if new_names:
+            docs = self.docs
+            self.names.extend(n for n in set(new_names) if n[1] in docs and docs[n[1]][0] == n[0])
+            self.names.sort()
+        self.last = None
+
+    def _index(self, app, tags):
+        # Indexes app everywhere but the sorted lists; returns its new tokens
+        if app.path in self.docs:
+            self.remove(app.path)
+
+        name, tokens, haystack = self.tokenize(app, tags)
+        self.docs[app.path] = (name, tokens, haystack)
+        new_tokens = []
+        for token in tokens:
+            paths = self.postings.get(token)
+            if paths is None:
+                paths = self.postings[token] = set()
+                new_tokens.append(token)
+            paths.add(app.path)
+        for c in set(haystack):
+            self.chars.setdefault(c, set()).add(app.path)
+        return new_tokens
+
+    def remove(self, path):
+        doc = self.docs.pop(path, None)
+        if doc is None:
+            return
+        for token in doc[1]:
+            paths = self.postings.get(token)
+            if paths is None:
+                continue
+            paths.discard(path)
+            if not paths:
+                del self.postings[token]
+                i = bisect.bisect_left(self.tokens, token)
+                if i < len(self.tokens) and self.tokens[i] == token:
+                    del self.tokens[i]
+        for c in set(doc[2]):
+            paths = self.chars.get(c)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self.chars[c]
+        i = bisect.bisect_left(self.names, (doc[0], path))
+        if i < len(self.names) and self.names[i] == (doc[0], path):
+            del self.names[i]
+        self.last = None
+
+    def rebuild(self, apps, tags=None):
+        tags = tags or {}
+        self.docs.clear()
+        self.postings.clear()
+        self.tokens = []
+        self.chars.clear()
+        self.names = []
+        self.extend(apps, tags)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def prefix(self, term):
+        # Paths having a token that starts with term
+        hits = set()
+        i = bisect.bisect_left(self.tokens, term)
+        while i < len(self.tokens) and self.tokens[i].startswith(term):
+            hits.update(self.postings[self.tokens[i]])
+            i += 1
+        return hits
+
+    def search(self, query):
+        """
+        Returns {path: score} for apps matching every term of query, or None
+        for an empty query (no filtering). Lower scores are better matches.
+        """
+        query = " ".join(query.lower().split())
+        if not query:
+            return None
+
+        # Typing more characters can only narrow the result, as long as the
+        # previous search wasn't cut short
+        candidates = None
+        if self.last is not None and self.last[2] and query.startswith(self.last[0]):
+            candidates = set(self.last[1])
+
+        complete = True
+        fuzzy = set()
+        for term in query.split():
+            hits = self.prefix(term)
+            if candidates is not None:
+                hits &= candidates
+            if len(hits) < FUZZY_THRESHOLD:
+                loose = self.fuzzy(term, candidates, hits)
+                fuzzy |= loose
+                hits |= loose
+            else:
+                # Plenty of real matches; a fuzzy pass would only add noise
+                complete = False
+            candidates = hits
+            if not candidates:
+                break
+
+        results = dict.fromkeys(candidates, TOKEN_PREFIX)
+        for path in fuzzy & candidates:
+            results[path] = FUZZY
+        i = bisect.bisect_left(self.names, (query,))
+        while i < len(self.names) and self.names[i][0].startswith(query):
+            if self.names[i][1] in results:
+                results[self.names[i][1]] = NAME_PREFIX
+            i += 1
+
+        self.last = (query, results, complete)
+        return results
+
+    def fuzzy(self, term, candidates, exclude):
+        # Subsequence matches on name/entry point among candidates (None =
+        # all apps) that the prefix lookup didn't already find
+        for c in set(term):
+            paths = self.chars.get(c)
+            if not paths:
+                return set()
+            candidates = paths.intersection(candidates) if candidates is not None else set(paths)
+        candidates -= exclude
+        if len(term) == 1 or not candidates:
+            return candidates
+
+        pattern = re.compile(".*?".join(re.escape(c) for c in term))
+        docs = self.docs
+        return {path for path in candidates if pattern.search(docs[path][2])}
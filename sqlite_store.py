@@ -0,0 +1,222 @@
+import json
+import os
+import sqlite3
+import threading
+
+from config_manager import _apply_op, _default_config
+
+# Config keys that get their own indexed table; everything else is a JSON
+# value in the settings table
+TABLE_KEYS = ("manual_apps", "app_overrides", "ignored_apps")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS manual_apps (path TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS app_overrides (path TEXT PRIMARY KEY, entry_point TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS ignored_apps (path TEXT PRIMARY KEY);
+"""
+
+class SqliteConfigStore:
+    """
+    Config kept in SQLite instead of config.json, for large inventories.
+
+    Manual apps, overrides and ignored apps live in tables keyed by path,
+    so adding or removing one writes a single indexed row instead of
+    rewriting the whole document. Other settings are stored as JSON values
+    by key.
+
+    Offers the same get/mutate/put/flush/invalidate interface as the JSON
+    cache in config_manager. get() returns a dict assembled from the tables
+    once and then kept up to date by mutate() and put(): appends and
+    overrides are O(1) there, while a remove filters the one cached list
+    in memory (no disk access). Commits from other processes are detected
+    through PRAGMA data_version.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self.data = None
+        self.version = None
+
+    def is_empty(self):
+        with self.lock:
+            for table in ("settings",) + TABLE_KEYS:
+                if self.conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+                    return False
+            return True
+
+    def _data_version(self):
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get(self):
+        with self.lock:
+            version = self._data_version()
+            if self.data is None or version != self.version:
+                self.data = self._read()
+                self.version = version
+            return self.data
+
+    def _read(self):
+        data = _default_config()
+        for key, value in self.conn.execute("SELECT key, value FROM settings"):
+            data[key] = json.loads(value)
+        data["manual_apps"] = [
+            json.loads(row[0]) for row in self.conn.execute("SELECT data FROM manual_apps ORDER BY rowid")
+        ]
+        data["app_overrides"] = dict(self.conn.execute("SELECT path, entry_point FROM app_overrides"))
+        data["ignored_apps"] = [
+            row[0] for row in self.conn.execute("SELECT path FROM ignored_apps ORDER BY rowid")
+        ]
+        return data
+
+    def mutate(self, op):
+        with self.lock:
+            data = self.get()
+            try:
+                with self.conn:
+                    changed = self._execute(op)
+            except sqlite3.Error as e:
+                print(f"Error writing config database: {e}")
+                self.data = None
+                return
+
+            if changed:
+                self._apply_cached(data, op)
+            # Our own commit bumps nothing for us, but keep the stamp fresh
+            self.version = self._data_version()
+
+    def _execute(self, op):
+        kind, key = op[0], op[1]
+        cur = self.conn.cursor()
+        if key == "manual_apps" and kind == "append":
+            cur.execute("INSERT OR IGNORE INTO manual_apps (path, data) VALUES (?, ?)",
+                        (op[2]["path"], json.dumps(op[2])))
+        elif key == "manual_apps" and kind == "remove":
+            cur.execute("DELETE FROM manual_apps WHERE path = ?", (op[2],))
+        elif key == "ignored_apps" and kind == "append":
+            cur.execute("INSERT OR IGNORE INTO ignored_apps (path) VALUES (?)", (op[2],))
+        elif key == "ignored_apps" and kind == "remove":
+            cur.execute("DELETE FROM ignored_apps WHERE path = ?", (op[2],))
+        elif key == "app_overrides" and kind == "set_item":
+            cur.execute("INSERT OR REPLACE INTO app_overrides (path, entry_point) VALUES (?, ?)",
+                        (op[2], op[3]))
+        elif key == "app_overrides" and kind == "del_item":
+            cur.execute("DELETE FROM app_overrides WHERE path = ?", (op[2],))
+        elif key in TABLE_KEYS:
+            raise ValueError(f"Unsupported config op for {key}: {kind}")
+        else:
+            # Small settings: read-modify-write the one JSON value
+            row = cur.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+            holder = {key: json.loads(row[0])} if row else {}
+            if not _apply_op(holder, op):
+                return False
+            cur.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                        (key, json.dumps(holder[key])))
+        return cur.rowcount > 0
+
+    def _apply_cached(self, data, op):
+        # Mirror a committed op into the cached dict; for appends the
+        # database already did the duplicate check, so no list scan
+        kind, key = op[0], op[1]
+        if kind == "append" and key in ("manual_apps", "ignored_apps"):
+            data.setdefault(key, []).append(op[2])
+        else:
+            # Removes filter the one cached list in memory (O(n), but far
+            # cheaper than re-reading every table)
+            _apply_op(data, op)
+
+    def has_manual_app(self, path):
+        with self.lock:
+            row = self.conn.execute("SELECT 1 FROM manual_apps WHERE path = ?", (path,)).fetchone()
+            return row is not None
+
+    def put(self, data):
+        # Whole-document replace, in one transaction
+        with self.lock:
+            try:
+                with self.conn:
+                    self._replace_all(data)
+            except sqlite3.Error as e:
+                print(f"Error writing config database: {e}")
+                self.data = None
+                return
+            # Cache what the tables now hold instead of reading them back
+            self.data = self._as_stored(data)
+            self.version = self._data_version()
+
+    @staticmethod
+    def _as_stored(data):
+        # data as _read() would return it after _replace_all(): JSON values,
+        # and first entry wins for duplicate paths (INSERT OR IGNORE)
+        stored = _default_config()
+        stored.update(json.loads(json.dumps(data)))
+        seen = set()
+        manual = []
+        for app in stored.get("manual_apps", []):
+            if app["path"] not in seen:
+                seen.add(app["path"])
+                manual.append(app)
+        stored["manual_apps"] = manual
+        stored["ignored_apps"] = list(dict.fromkeys(stored.get("ignored_apps", [])))
+        return stored
+
+    def _replace_all(self, data):
+        cur = self.conn.cursor()
+        for table in ("settings",) + TABLE_KEYS:
+            cur.execute(f"DELETE FROM {table}")
+        cur.executemany(
+            "INSERT OR IGNORE INTO manual_apps (path, data) VALUES (?, ?)",
+            [(app["path"], json.dumps(app)) for app in data.get("manual_apps", [])]
+        )
+        cur.executemany(
+            "INSERT OR REPLACE INTO app_overrides (path, entry_point) VALUES (?, ?)",
+            list(data.get("app_overrides", {}).items())
+        )
+        cur.executemany(
+            "INSERT OR IGNORE INTO ignored_apps (path) VALUES (?)",
+            [(path,) for path in data.get("ignored_apps", [])]
+        )
+        cur.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in data.items() if key not in TABLE_KEYS]
+        )
+
+    def flush(self):
+        # Every mutation is committed as it happens
+        pass
+
+    def invalidate(self):
+        with self.lock:
+            self.data = None
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def migrate_json(store, json_cache, config_file):
+    """
+    One-time import of config.json (plus its journal) into an empty store.
+    The JSON file is renamed to <name>.migrated afterwards so it isn't
+    picked up again, and stays around as a backup.
+    """
+    if not store.is_empty() or not os.path.exists(config_file):
+        return False
+
+    data = json_cache.get()
+    store.put(data)
+    json_cache.flush()
+    try:
+        os.replace(config_file, config_file + ".migrated")
+        journal = config_file + ".journal"
+        if os.path.exists(journal):
+            os.remove(journal)
+    except OSError as e:
+        print(f"Error archiving {config_file} after migration: {e}")
+    print(f"Migrated {config_file} to {store.path}")
+    return True
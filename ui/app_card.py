@@ -2,16 +2,19 @@
 import os
 import datetime
 import customtkinter as ctk
-from process_runner import ProcessRunner
 
 class AppCard(ctk.CTkFrame):
-    def __init__(self, master, app_model, run_callback, edit_callback=None, delete_callback=None, **kwargs):
+    def __init__(self, master, app_model, run_callback, edit_callback=None, delete_callback=None, stop_callback=None, logs_callback=None, **kwargs):
         super().__init__(master, **kwargs)
         
         self.app_model = app_model
         self.run_callback = run_callback
         self.edit_callback = edit_callback
         self.delete_callback = delete_callback
+        self.stop_callback = stop_callback
+        self.logs_callback = logs_callback
+        self.running = False
+        self.metrics_text = ""
 
         # --- Ultra-Modern aesthetic (Zinc & Indigo) ---
         self.configure(
@@ -28,33 +31,37 @@ class AppCard(ctk.CTkFrame):
         # 1. Header with Icon
         self.label_name = ctk.CTkLabel(
             self, 
-            text=f"📦 {self.app_model.name}",
+            text="",
             font=("Segoe UI", 16, "bold"),
             text_color="#fafafa", # Zinc-50
             anchor="w"
         )
-        self.label_name.grid(row=0, column=0, padx=20, pady=(20, 5), sticky="ew")
+        self.label_name.grid(row=0, column=0, padx=(20, 0), pady=(20, 5), sticky="ew")
 
-        # 2. Subtitle: Metadata (Dense)
-        # Calculate Last Modified
-        try:
-            mtime = os.path.getmtime(self.app_model.path)
-            dt = datetime.datetime.fromtimestamp(mtime).strftime("%b %d, %H:%M")
-        except:
-            dt = "Unknown"
+        # Live CPU / memory / uptime while the app runs; its own column, so
+        # the (opaque) label doesn't cover the end of a long name
+        self.label_metrics = ctk.CTkLabel(
+            self,
+            text="",
+            font=("Consolas", 11),
+            text_color="#a1a1aa", # Zinc-400
+            anchor="e"
+        )
+        self.label_metrics.grid(row=0, column=1, padx=(10, 20), pady=(20, 5), sticky="e")
 
+        # 2. Subtitle: Metadata (Dense)
         self.label_detail = ctk.CTkLabel(
             self, 
-            text=f"{self.app_model.entry_point}  •  Updated {dt}",
+            text="",
             font=("Segoe UI", 12),
             text_color="#71717a", # Zinc-500
             anchor="w"
         )
-        self.label_detail.grid(row=1, column=0, padx=24, pady=(0, 15), sticky="ew")
+        self.label_detail.grid(row=1, column=0, columnspan=2, padx=24, pady=(0, 15), sticky="ew")
 
         # 3. Utility Actions (Row 2) - Small Ghost Buttons
         self.util_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.util_frame.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.util_frame.grid(row=2, column=0, columnspan=2, padx=20, pady=(0, 10), sticky="ew")
         
         # Open Folder
         self.btn_folder = ctk.CTkButton(
@@ -88,6 +95,24 @@ class AppCard(ctk.CTkFrame):
         )
         self.btn_edit.pack(side="left")
 
+        # Captured output
+        if self.logs_callback:
+            self.btn_logs = ctk.CTkButton(
+                self.util_frame,
+                text="📜 Logs",
+                font=("Segoe UI", 11, "bold"),
+                width=70,
+                height=28,
+                fg_color="transparent",
+                border_width=1,
+                border_color="#3f3f46",
+                hover_color="#27272a",
+                text_color="#a1a1aa",
+                corner_radius=14,
+                command=self.on_logs
+            )
+            self.btn_logs.pack(side="left", padx=(8, 0))
+
         # Configure/Override (Gear Icon)
         if self.edit_callback:
             self.btn_config = ctk.CTkButton(
@@ -122,7 +147,7 @@ class AppCard(ctk.CTkFrame):
 
         # 4. Primary Actions (Row 3)
         self.btn_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.btn_frame.grid(row=3, column=0, padx=20, pady=(10, 20), sticky="ew")
+        self.btn_frame.grid(row=3, column=0, columnspan=2, padx=20, pady=(10, 20), sticky="ew")
         self.btn_frame.grid_columnconfigure(0, weight=1)
         self.btn_frame.grid_columnconfigure(1, weight=1)
 
@@ -154,13 +179,102 @@ class AppCard(ctk.CTkFrame):
         )
         self.btn_admin.grid(row=0, column=1, sticky="ew")
 
+        if self.app_model is not None:
+            self.set_app(self.app_model)
+
+    def set_app(self, app_model, running=False):
+        # Rebind this card to another app (cards are pooled by the Dashboard)
+        self.app_model = app_model
+        self.running = None
+        self.set_running(running)
+        self.set_metrics(None)
+        # Details are filled in once the MetadataLoader gets to this app
+        self.set_metadata(app_model.metadata)
+
+    def set_metadata(self, meta):
+        parts = [self.app_model.entry_point]
+        if meta is not None:
+            if meta.entry_size is not None:
+                parts[0] += f" ({self.format_bytes(meta.entry_size)})"
+            if meta.mtime is not None:
+                parts.append("Updated " + datetime.datetime.fromtimestamp(meta.mtime).strftime("%b %d, %H:%M"))
+            if meta.git_branch:
+                parts.append(f"⎇ {meta.git_branch}{'*' if meta.git_dirty else ''}")
+            if meta.has_venv:
+                parts.append("venv")
+
+        self.label_detail.configure(text="  •  ".join(parts))
+
+    def set_running(self, running):
+        if running == self.running:
+            return
+        self.running = running
+
+        icon = "🟢" if running else "📦"
+        self.label_name.configure(text=f"{icon} {self.app_model.name}")
+
+        # While the app is up, the primary button stops it instead
+        if running and self.stop_callback:
+            self.btn_run.configure(
+                text="■ Stop",
+                command=self.on_stop,
+                fg_color="#ef4444",    # Red-500
+                hover_color="#dc2626"  # Red-600
+            )
+        else:
+            self.btn_run.configure(
+                text="🚀 Launch",
+                command=self.on_run,
+                fg_color="#6366f1",    # Indigo-500
+                hover_color="#4f46e5"  # Indigo-600
+            )
+
+    def set_metrics(self, metrics):
+        # metrics is (cpu_percent, rss_bytes, uptime_seconds) or None
+        if metrics is None:
+            text = ""
+        else:
+            cpu, rss, uptime = metrics
+            text = f"{cpu:.0f}%  {self.format_bytes(rss)}  {self.format_uptime(uptime)}"
+
+        # Samples arrive every few seconds for every card; skip no-op redraws
+        if text != self.metrics_text:
+            self.metrics_text = text
+            self.label_metrics.configure(text=text)
+
+    @staticmethod
+    def format_bytes(size):
+        for unit in ("B", "KB", "MB"):
+            if size < 1024:
+                return f"{size:.0f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GB"
+
+    @staticmethod
+    def format_uptime(seconds):
+        seconds = int(seconds)
+        if seconds < 60:
+            return f"{seconds}s"
+        if seconds < 3600:
+            return f"{seconds // 60}m"
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
     def on_run(self):
         self.run_callback(self.app_model, as_admin=False)
 
+    def on_logs(self):
+        if self.logs_callback:
+            self.logs_callback(self.app_model)
+
+    def on_stop(self):
+        if self.stop_callback:
+            self.stop_callback(self.app_model)
+
     def on_run_admin(self):
         self.run_callback(self.app_model, as_admin=True)
 
     def open_folder(self):
+        from process_runner import ProcessRunner
         ProcessRunner.open_directory(self.app_model.path)
 
     def on_configure(self):
@@ -172,5 +286,6 @@ class AppCard(ctk.CTkFrame):
             self.delete_callback(self.app_model)
 
     def edit_code(self):
+        from process_runner import ProcessRunner
         script_path = os.path.join(self.app_model.path, self.app_model.entry_point)
         ProcessRunner.open_in_editor(script_path)
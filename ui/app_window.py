@@ -1,19 +1,35 @@
 
 import threading
-import queue
+import time
 import customtkinter as ctk
-from tkinter import filedialog
 import os
 import sys
 
 from config_manager import ConfigManager
-from app_scanner import AppScanner, AppModel
-from process_runner import ProcessRunner
+from app_model import AppModel
+from app_catalog import AppCatalog
+from process_registry import ProcessRegistry
+from process_state import ProcessStateFile
+from app_metadata import MetadataLoader
+from preload import StartupPreload
 from ui.dashboard import Dashboard
-from ui.add_app_dialog import AddAppDialog
+from ui.dispatcher import UiDispatcher
+
+# Only what the first paint needs is imported above. The scanner, process
+# runner (ctypes), watcher, monitor and dialogs are imported where they're
+# first used, after the window is up.
+
+# Scan results are pushed to the UI once this many apps have been found, or
+# after this many seconds, whichever comes first
+SCAN_BATCH_SIZE = 24
+SCAN_BATCH_INTERVAL = 0.05
 
 class AppWindow(ctk.CTk):
     def __init__(self):
+        # Config and the last scan are read while Tk builds the window
+        preload = StartupPreload()
+        preload.start()
+
         super().__init__()
 
         self.title("App Manager Logic")
@@ -40,15 +56,72 @@ class AppWindow(ctk.CTk):
         self.main_container.pack(fill="both", expand=True)
 
         # State
-        self.current_path = ConfigManager.get_root_dir()
-        self.scan_queue = queue.Queue()
-        
+        preload.join()
+        self.current_path = preload.root_dir or ConfigManager.get_root_dir()
+        # Single pump for everything background threads post to the UI;
+        # producers wake it, so an idle window does no polling
+        self.dispatcher = UiDispatcher(self, self.handle_message)
+        self.dashboard = None
+        self.watchers = []
+
+        # Scans are numbered; messages from any but the latest are dropped.
+        # At most one scan thread runs at a time, and refresh requests made
+        # while it is still running collapse into a single rescan.
+        self.scan_generation = 0
+        self.scan_cancel = None
+        self.scan_running = False
+        self.scan_pending = False
+
+        # Process state changes arrive on the reaper thread; hop onto our queue
+        self.registry = ProcessRegistry.shared()
+        self.registry.subscribe(lambda kind, record: self.dispatcher.post("process", record))
+        # Record launches on disk too, so the CLI can see and stop them
+        ProcessStateFile.shared().attach(self.registry)
+
+        # Card details (mtime, git state, ...) are read in the background
+        self.metadata_loader = MetadataLoader(self.dispatcher.post)
+
+        self.monitor = None
+
         if self.current_path and os.path.exists(self.current_path):
-            self.show_dashboard()
+            self.show_dashboard(cached_apps=preload.apps)
         else:
             self.show_setup()
 
+        # Idle callbacks run once the first frame has been drawn
+        self.after_idle(self.start_background_work)
+
+    def start_background_work(self):
+        from resource_monitor import ResourceMonitor
+
+        # CPU / memory of running apps, sampled off the UI thread
+        interval = ConfigManager.get_monitor_interval()
+        if interval:
+            self.monitor = ResourceMonitor(
+                self.registry,
+                self.dispatcher.post,
+                interval=interval
+            )
+            self.monitor.start()
+
+        # Start warming an interpreter for the common no-venv case
+        if ConfigManager.get_fast_launch():
+            threading.Thread(target=self.warm_default_python, daemon=True).start()
+
+    def warm_default_python(self):
+        from interpreter_resolver import InterpreterResolver
+        from warm_pool import WarmPool
+
+        WarmPool.shared().warm(InterpreterResolver.shared().default_python())
+
+    def prewarm(self, paths):
+        from interpreter_resolver import InterpreterResolver
+
+        InterpreterResolver.shared().prewarm(paths)
+
     def show_setup(self):
+        self.cancel_scan()
+        self.stop_watcher()
         self.clear_container()
         
         frame = ctk.CTkFrame(self.main_container)
@@ -60,8 +133,11 @@ class AppWindow(ctk.CTk):
         btn = ctk.CTkButton(frame, text="Browse Folder", command=self.select_directory)
         btn.pack(padx=40, pady=(0, 40))
 
-    def show_dashboard(self):
+    def show_dashboard(self, cached_apps=None):
+        self.stop_watcher()
+        self.metadata_loader.discard()
         self.clear_container()
+        self.dashboard = None
 
         # Top Bar: Seamless, transparent feel
         top_bar = ctk.CTkFrame(
@@ -90,7 +166,31 @@ class AppWindow(ctk.CTk):
         )
         path_lbl.pack(side="left", padx=20, pady=34)
 
+        # Scan progress / app count
+        self.status_lbl = ctk.CTkLabel(
+            top_bar,
+            text="",
+            text_color="#52525b", # Zinc-600
+            font=("Segoe UI", 13)
+        )
+        self.status_lbl.pack(side="left", padx=(0, 20), pady=34)
+
         # 3. Actions (Right Aligned)
+
+        # Search (filters the dashboard as you type)
+        self.search_entry = ctk.CTkEntry(
+            top_bar,
+            placeholder_text="🔍 Search apps",
+            font=("Segoe UI", 13),
+            width=220,
+            height=42,
+            corner_radius=21,
+            fg_color="#18181b",     # Zinc-900
+            border_color="#27272a", # Zinc-800
+            text_color="#e4e4e7"
+        )
+        self.search_entry.bind("<KeyRelease>", self.on_search)
+        self.search_entry.bind("<Escape>", self.clear_search)
         
         # Add Custom App (Solid Pill)
         add_btn = ctk.CTkButton(
@@ -122,6 +222,26 @@ class AppWindow(ctk.CTk):
         )
         refresh_btn.pack(side="right", padx=(0, 15), pady=30)
 
+        # Launch Group (only when groups are configured)
+        groups = sorted(ConfigManager.get_app_groups())
+        self.group_menu = None
+        if groups:
+            self.group_menu = ctk.CTkOptionMenu(
+                top_bar,
+                values=groups,
+                font=("Segoe UI", 13, "bold"),
+                width=150,
+                height=42,
+                corner_radius=21,
+                fg_color="#27272a",     # Zinc-800
+                button_color="#3f3f46",
+                button_hover_color="#52525b",
+                text_color="#e4e4e7",
+                command=self.launch_group
+            )
+            self.group_menu.set("▶ Launch Group")
+            self.group_menu.pack(side="right", padx=(0, 15), pady=30)
+
         # Change Dir (Ghost/Outline Pill)
         change_dir_btn = ctk.CTkButton(
             top_bar, 
@@ -138,6 +258,7 @@ class AppWindow(ctk.CTk):
             command=self.select_directory
         )
         change_dir_btn.pack(side="right", padx=(0, 15), pady=30)
+        self.search_entry.pack(side="right", padx=(0, 15), pady=30)
 
         # Content - Loading State
         self.loading_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
@@ -150,51 +271,219 @@ class AppWindow(ctk.CTk):
             text_color="#52525b"
         )
         self.loading_lbl.place(relx=0.5, rely=0.5, anchor="center")
-        
+
+        # Paint what the last scan found right away; the fresh scan below
+        # reconciles it in place
+        if cached_apps:
+            self.create_dashboard(cached_apps)
+            self.status_lbl.configure(text=f"{len(cached_apps)} apps (refreshing...)")
+
+        self.start_scan()
+
+    def start_scan(self):
+        # Supersede whatever scan is running; its late results get dropped
+        self.scan_generation += 1
+        if self.scan_running:
+            self.scan_cancel.set()
+            self.scan_pending = True
+            return
+        self.launch_scan()
+
+    def launch_scan(self):
         # Run scan in thread
-        threading.Thread(target=self.run_scan, args=(self.current_path,), daemon=True).start()
-        self.after(100, self.check_scan_queue)
+        self.scan_running = True
+        self.scan_cancel = threading.Event()
+        threading.Thread(
+            target=self.run_scan,
+            args=(self.current_path, self.scan_generation, self.scan_cancel),
+            daemon=True
+        ).start()
+
+    def cancel_scan(self):
+        self.scan_generation += 1
+        self.scan_pending = False
+        if self.scan_cancel is not None:
+            self.scan_cancel.set()
+
+    def scan_roots(self, path):
+        # The chosen projects folder plus any extra "scan_roots" from config
+        roots = [path]
+        for root in ConfigManager.get_scan_roots():
+            if os.path.normpath(root) != os.path.normpath(path) and os.path.isdir(root):
+                roots.append(root)
+        return roots
+
+    def run_scan(self, path, generation, cancel):
+        try:
+            self.stream_scan(path, generation, cancel)
+        finally:
+            self.dispatcher.post("scan_exit", generation)
+
+    def stream_scan(self, path, generation, cancel):
+        catalog = AppCatalog()
+        batch = []
+        last_flush = time.monotonic()
+
+        # Stream results to the UI in small batches so the first cards show
+        # up long before the slowest folder has been probed
+        from app_scanner import AppScanner
+        from scan_snapshot import save_snapshot
+
+        for app in AppScanner.iter_scan(self.scan_roots(path), cancel=cancel):
+            if cancel.is_set():
+                return
+            catalog.add(app)
+            batch.append(app)
+            now = time.monotonic()
+            if len(batch) >= SCAN_BATCH_SIZE or now - last_flush >= SCAN_BATCH_INTERVAL:
+                self.dispatcher.post("scan_batch", (generation, path, batch, len(catalog)))
+                batch = []
+                last_flush = now
+        if cancel.is_set():
+            # A partial result must not replace the dashboard or the snapshot
+            return
 
-    def run_scan(self, path):
-        apps = AppScanner.scan(path)
-        
         # Load manual apps
         manual_apps_data = ConfigManager.get_manual_apps()
         for app_data in manual_apps_data:
             # Avoid duplicates if they are already in scanned apps (by path)
-            if not any(existing.path == app_data["path"] for existing in apps):
-                apps.append(AppModel(
+            if app_data["path"] not in catalog:
+                app = AppModel(
                     name=app_data["name"],
                     path=app_data["path"],
                     entry_point=app_data["entry_point"]
-                ))
-        
-        self.scan_queue.put(apps)
-
-    def check_scan_queue(self):
-        try:
-            apps = self.scan_queue.get_nowait()
-            # Scan complete
-            if hasattr(self, 'loading_frame'):
-                self.loading_frame.destroy()
-            
-            if hasattr(self, 'loading_frame'):
-                self.loading_frame.destroy()
-            
-            self.dashboard = Dashboard(
-                self.main_container, 
-                apps, 
-                self.run_app, 
-                edit_callback=self.edit_entry_point,
-                delete_callback=self.delete_app
-            )
-            self.dashboard.pack(fill="both", expand=True, padx=40, pady=20)
-            
-        except queue.Empty:
-            # Check again soon
-            self.after(100, self.check_scan_queue)
+                )
+                catalog.add(app)
+                batch.append(app)
+
+        if batch:
+            self.dispatcher.post("scan_batch", (generation, path, batch, len(catalog)))
+        apps = list(catalog)
+        self.dispatcher.post("scan_done", (generation, path, apps))
+        save_snapshot(path, apps)
+
+    def handle_message(self, kind, payload):
+        if kind == "scan_batch":
+            generation, path, batch, found = payload
+            if generation == self.scan_generation:
+                self.on_scan_batch(batch, found)
+        elif kind == "scan_done":
+            generation, path, apps = payload
+            if generation == self.scan_generation:
+                self.on_scan_complete(path, apps)
+        elif kind == "scan_exit":
+            self.on_scan_exit()
+        elif self.dashboard is None:
+            # Watcher event for a dashboard that has been torn down
+            return
+        elif kind == "app_added":
+            self.dashboard.add_app(payload)
+            self.prewarm([payload.path])
+        elif kind == "app_changed":
+            self.dashboard.update_app(payload)
+            self.prewarm([payload.path])
+        elif kind == "app_removed":
+            # A manual app stays until the user deletes it, even if its
+            # folder no longer has a detectable entry point
+            if not ConfigManager.is_manual_app(payload):
+                self.dashboard.remove_app(payload)
+        elif kind == "app_touched":
+            self.dashboard.invalidate_metadata(payload)
+        elif kind == "metadata":
+            self.dashboard.set_metadata(payload)
+        elif kind == "process":
+            self.dashboard.set_running(payload.app_path, payload.running)
+        elif kind == "metrics":
+            self.dashboard.set_metrics(payload)
+        elif kind == "group_app":
+            group, path, state = payload
+            self.status_lbl.configure(text=f"{group}: {os.path.basename(path)} {state}")
+        elif kind == "group_done":
+            group, states = payload
+            ready = sum(1 for state in states.values() if state == "ready")
+            self.status_lbl.configure(text=f"{group}: {ready}/{len(states)} apps ready")
+
+    def on_scan_exit(self):
+        # The scan thread is gone; run the rescan requested meanwhile, if any
+        self.scan_running = False
+        if self.scan_pending:
+            self.scan_pending = False
+            self.launch_scan()
+
+    def on_scan_batch(self, batch, found):
+        self.status_lbl.configure(text=f"Scanning... {found} found")
+        if self.dashboard is None:
+            self.create_dashboard(batch)
+        else:
+            # Only apps the dashboard doesn't know yet get added here;
+            # removals and changes are settled when the scan completes
+            self.dashboard.add_apps(batch)
+
+    def on_scan_complete(self, path, apps):
+        # Scan complete
+        self.status_lbl.configure(text=f"{len(apps)} apps")
+        if self.dashboard is None:
+            # Nothing streamed in -> show the empty state
+            self.create_dashboard(apps)
+        else:
+            self.dashboard.reconcile(apps)
+
+        # Resolve interpreters ahead of time so Launch doesn't have to,
+        # starting with the cards on screen
+        visible = set(self.dashboard.bound)
+        ordered = [a.path for a in apps if a.path in visible] + [a.path for a in apps if a.path not in visible]
+        self.prewarm(ordered)
+
+        # Keep the dashboard in sync with the projects folders from now on
+        self.start_watchers(path, apps)
+
+    def create_dashboard(self, apps):
+        if hasattr(self, 'loading_frame'):
+            self.loading_frame.destroy()
+
+        self.dashboard = Dashboard(
+            self.main_container,
+            apps,
+            self.run_app,
+            edit_callback=self.edit_entry_point,
+            delete_callback=self.delete_app,
+            stop_callback=self.stop_app,
+            logs_callback=self.show_logs,
+            metadata_callback=self.metadata_loader.request
+        )
+        self.dashboard.running = {record.app_path for record in self.registry.running()}
+        self.dashboard.set_query(self.search_entry.get())
+        self.dashboard.pack(fill="both", expand=True, padx=40, pady=20)
+
+    def on_search(self, event=None):
+        if self.dashboard is not None:
+            self.dashboard.set_query(self.search_entry.get())
+
+    def clear_search(self, event=None):
+        self.search_entry.delete(0, "end")
+        self.on_search()
+
+    def start_watchers(self, path, apps):
+        from fs_watcher import FolderWatcher
+
+        self.stop_watcher()
+        roots = self.scan_roots(path)
+        # Manual apps are listed by config, not by what detection finds
+        detected = [app for app in apps if not ConfigManager.is_manual_app(app.path)]
+        for root in roots:
+            # Each watcher keeps the apps that belong to its own root
+            watcher = FolderWatcher(root, detected, self.dispatcher.post, roots=roots)
+            watcher.start()
+            self.watchers.append(watcher)
+
+    def stop_watcher(self):
+        for watcher in self.watchers:
+            watcher.stop()
+        self.watchers = []
 
     def select_directory(self):
+        from tkinter import filedialog
+
         path = filedialog.askdirectory()
         if path:
             ConfigManager.set_root_dir(path)
@@ -202,20 +491,35 @@ class AppWindow(ctk.CTk):
             self.show_dashboard()
 
     def refresh_dashboard(self):
-        # Simply reload the whole dashboard to ensure clean state and correct packing order
-        if self.current_path:
+        if not self.current_path:
+            return
+
+        if self.dashboard is None:
             self.show_dashboard()
+        else:
+            # Rescan in place; the dashboard diffs the result against its cards
+            self.status_lbl.configure(text="Refreshing...")
+            self.start_scan()
 
     def add_custom_app(self):
+        from ui.add_app_dialog import AddAppDialog
+
         # Open Dialog
         AddAppDialog(self, callback=self.on_app_added)
 
     def on_app_added(self, app_data):
         # Save to config
         ConfigManager.add_manual_app(app_data)
-        
-        # Refresh
-        self.refresh_dashboard()
+
+        if self.dashboard is None:
+            self.refresh_dashboard()
+            return
+
+        self.dashboard.add_app(AppModel(
+            name=app_data["name"],
+            path=app_data["path"],
+            entry_point=app_data["entry_point"]
+        ))
 
     def edit_entry_point(self, app_model):
         # Open file dialog startign at app path
@@ -223,6 +527,8 @@ class AppWindow(ctk.CTk):
         if not os.path.exists(initial_dir):
             initial_dir = self.current_path
 
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename(
             initialdir=initial_dir,
             title=f"Select Entry Point for {app_model.name}",
@@ -237,26 +543,71 @@ class AppWindow(ctk.CTk):
             new_entry = os.path.basename(file_path)
             # Store override
             ConfigManager.add_app_override(app_model.path, new_entry)
-            
-            self.refresh_dashboard()
+
+            if self.dashboard is None:
+                self.refresh_dashboard()
+                return
+
+            is_batch = os.path.splitext(new_entry)[1].lower() in (".bat", ".cmd")
+            self.dashboard.update_app(AppModel(
+                name=app_model.name,
+                path=app_model.path,
+                entry_point=new_entry,
+                app_type="batch" if is_batch else "python",
+                venv=app_model.venv
+            ))
 
     def delete_app(self, app_model):
         # Check if it was a manual app
-        manual_apps = ConfigManager.get_manual_apps()
-        is_manual = any(app["path"] == app_model.path for app in manual_apps)
+        is_manual = ConfigManager.is_manual_app(app_model.path)
 
         if is_manual:
             ConfigManager.remove_manual_app(app_model.path)
         else:
             # It's an auto-scanned app -> add to ignore list
             ConfigManager.add_ignored_app(app_model.path)
-        
-        self.refresh_dashboard()
+
+        if self.dashboard is None:
+            self.refresh_dashboard()
+        else:
+            self.dashboard.remove_app(app_model.path)
 
     def run_app(self, app_model, as_admin):
+        from process_runner import ProcessRunner
+
         print(f"Running {app_model.name} (Admin: {as_admin})...")
         ProcessRunner.run_app(app_model, as_admin)
 
+    def stop_app(self, app_model):
+        from process_runner import ProcessRunner
+
+        print(f"Stopping {app_model.name}...")
+        ProcessRunner.stop_app(app_model)
+
+    def launch_group(self, name):
+        # The menu is an action list, not a selection
+        self.group_menu.set("▶ Launch Group")
+        from process_runner import ProcessRunner
+
+        apps_by_path = {app.path: app for app in self.dashboard.apps} if self.dashboard else {}
+        try:
+            ProcessRunner.launch_group(
+                name,
+                apps_by_path,
+                self.dispatcher.post
+            )
+        except (KeyError, ValueError) as e:
+            print(f"Error launching group: {e}")
+
+    def show_logs(self, app_model):
+        record = self.registry.latest(app_model.path)
+        if record is None or record.log is None:
+            print(f"No captured output for {app_model.name} (enable capture_output in config.json)")
+            return
+
+        from ui.log_panel import LogPanel
+        LogPanel(self, record)
+
     def clear_container(self):
         for widget in self.main_container.winfo_children():
             widget.destroy()
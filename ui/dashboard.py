@@ -1,53 +1,482 @@
-
+import sys
+import tkinter
 import customtkinter as ctk
+from app_catalog import AppCatalog
+from config_manager import ConfigManager
+from search_index import SearchIndex
 from .app_card import AppCard
 
-class Dashboard(ctk.CTkScrollableFrame):
-    def __init__(self, master, apps, run_callback, edit_callback=None, delete_callback=None, **kwargs):
-        # Premium Scrollbar Styling (Zinc Theme)
-        super().__init__(
-            master, 
-            fg_color="transparent",
-            scrollbar_button_color="#27272a", 
-            scrollbar_button_hover_color="#3f3f46", 
-            **kwargs
-        )
-        self.apps = apps
+class Dashboard(ctk.CTkFrame):
+    """
+    Virtualized app grid.
+
+    Only the rows inside the viewport (plus OVERSCAN rows above and below)
+    have AppCard widgets. Cards live in a pool and are rebound to whichever
+    AppModel scrolls into their slot, so building the dashboard costs the
+    same for 20 apps as it does for 2,000.
+
+    set_query() filters the grid through a SearchIndex kept in step with
+    the app list; filtering only changes which apps get laid out, no cards
+    are rebuilt.
+    """
+
+    CARD_HEIGHT = 190
+    PADDING = 15
+    OVERSCAN = 1
+    SCROLL_STEP = 40
+
+    def __init__(self, master, apps, run_callback, edit_callback=None, delete_callback=None, stop_callback=None, logs_callback=None, metadata_callback=None, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.apps = list(apps)
         self.run_callback = run_callback
         self.edit_callback = edit_callback
         self.delete_callback = delete_callback
-        
-        # Grid Layout
-        self.grid_columnconfigure((0, 1, 2), weight=1) # 3 columns for desktop
-        
-        self.cards = []
+        self.stop_callback = stop_callback
+        self.logs_callback = logs_callback
+        # Called with apps whose card needs metadata that isn't loaded yet
+        self.metadata_callback = metadata_callback
+        # Paths of apps with a live process
+        self.running = set()
+        # app path -> (cpu_percent, rss_bytes, uptime_seconds) from the ResourceMonitor
+        self.metrics = {}
+        self.columns = 3 # 3 columns for desktop
+
+        self.canvas = tkinter.Canvas(
+            self,
+            bg=self._apply_appearance_mode(self.cget("bg_color")),
+            highlightthickness=0,
+            bd=0,
+            yscrollincrement=int(self._apply_widget_scaling(self.SCROLL_STEP))
+        )
+        # Premium Scrollbar Styling (Zinc Theme)
+        self.scrollbar = ctk.CTkScrollbar(
+            self,
+            command=self.on_scrollbar,
+            button_color="#27272a",
+            button_hover_color="#3f3f46"
+        )
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        # Every card ever created, and its canvas window item
+        self.pool = []
+        self.window_ids = {}
+        # app path -> AppCard currently showing it
+        self.bound = {}
+        # Hidden cards ready to be rebound
+        self.free = []
+        # app path -> position in self.apps
+        self.index = {}
+
+        # Search state; self.filtered is what is actually laid out
+        self.search = SearchIndex()
+        self.tags = ConfigManager.get_app_tags()
+        self.query = ""
+        self.matches = None
+        self.filtered = self.apps
+
+        self.empty_lbl = None
+        self.refresh_pending = False
+
+        self.canvas.bind("<Configure>", self.on_canvas_configure)
+        # (sequence, funcid) of our app-wide wheel handlers, removed again in
+        # destroy() so rebuilt dashboards don't pile up handlers
+        self.wheel_bindings = []
+        # Windows wheel delta not yet turned into whole scroll units;
+        # touchpads and high-resolution wheels send less than 120 per event
+        self.wheel_remainder = 0
+        sequences = ("<Button-4>", "<Button-5>") if "linux" in sys.platform else ("<MouseWheel>",)
+        for sequence in sequences:
+            funcid = self.bind_all(sequence, self.on_mousewheel, add=True)
+            self.wheel_bindings.append((sequence, funcid))
+
         self.populate()
 
+    # --- Geometry ---
+
+    def row_pitch(self):
+        return self._apply_widget_scaling(self.CARD_HEIGHT + 2 * self.PADDING)
+
+    def row_count(self):
+        return (len(self.filtered) + self.columns - 1) // self.columns
+
+    def update_scrollregion(self):
+        width = self.canvas.winfo_width()
+        height = max(self.row_count() * self.row_pitch(), self.canvas.winfo_height())
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+
+    def visible_range(self):
+        # Index range [first, last) of apps that should have a card right now
+        pitch = self.row_pitch()
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        first_row = max(0, int(top // pitch) - self.OVERSCAN)
+        last_row = min(self.row_count(), int((top + height) // pitch) + 1 + self.OVERSCAN)
+        return first_row * self.columns, min(len(self.filtered), last_row * self.columns)
+
+    # --- Rendering ---
+
     def populate(self):
-        # Clear existing
-        for widget in self.winfo_children():
-            widget.destroy()
-        
-        if not self.apps:
-            # Empty State
-            lbl = ctk.CTkLabel(
-                self, 
-                text="No apps found in this directory.", 
-                font=("Roboto", 16),
-                text_color="#94A3B8"
+        self.index = {app.path: i for i, app in enumerate(self.apps)}
+        for path in list(self.bound):
+            self.release(path)
+
+        self.search.rebuild(self.apps, self.tags)
+        self.refilter()
+        self.update_scrollregion()
+        self.schedule_refresh()
+
+    def show_empty_state(self, text="No apps found in this directory."):
+        if self.empty_lbl is not None:
+            self.empty_lbl.configure(text=text)
+            return
+        self.empty_lbl = ctk.CTkLabel(
+            self.canvas,
+            text=text,
+            font=("Roboto", 16),
+            text_color="#94A3B8"
+        )
+        self.empty_lbl.place(relx=0.5, y=40, anchor="n")
+
+    def hide_empty_state(self):
+        if self.empty_lbl is not None:
+            self.empty_lbl.destroy()
+            self.empty_lbl = None
+
+    def schedule_refresh(self):
+        # Coalesce scroll/resize bursts into one refresh per idle cycle
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            self.after_idle(self.refresh)
+
+    def refresh(self):
+        self.refresh_pending = False
+        if not self.winfo_exists():
+            return
+
+        first, last = self.visible_range()
+        wanted = {self.filtered[i].path for i in range(first, last)}
+
+        # Hand back cards whose app scrolled out of view
+        for path in [p for p in self.bound if p not in wanted]:
+            self.release(path)
+
+        pad = self._apply_widget_scaling(self.PADDING)
+        col_width = max(1, self.canvas.winfo_width() // self.columns)
+        card_height = self._apply_widget_scaling(self.CARD_HEIGHT)
+        pitch = self.row_pitch()
+
+        shown = []
+        for i in range(first, last):
+            app = self.filtered[i]
+            card = self.bound.get(app.path)
+            if card is None:
+                card = self.acquire()
+                card.set_app(app, app.path in self.running)
+                card.set_metrics(self.metrics.get(app.path))
+                self.bound[app.path] = card
+                shown.append(app)
+            elif card.app_model is not app:
+                card.set_app(app, app.path in self.running)
+                card.set_metrics(self.metrics.get(app.path))
+                shown.append(app)
+
+            row, col = divmod(i, self.columns)
+            window_id = self.window_ids[card]
+            self.canvas.coords(window_id, col * col_width + pad, row * pitch + pad)
+            self.canvas.itemconfigure(
+                window_id,
+                width=max(1, col_width - 2 * pad),
+                height=card_height,
+                state="normal"
             )
-            lbl.pack(pady=40)
-            return
-
-        row = 0
-        col = 0
-        columns = 3
-        
-        for app in self.apps:
-            card = AppCard(self, app, self.run_callback, self.edit_callback, self.delete_callback)
-            card.grid(row=row, column=col, padx=15, pady=15, sticky="ew")
-            
-            col += 1
-            if col >= columns:
-                col = 0
-                row += 1
+
+        self.request_metadata(shown)
+
+    def acquire(self):
+        if self.free:
+            return self.free.pop()
+
+        card = AppCard(
+            self.canvas,
+            None,
+            self.run_callback,
+            self.edit_callback,
+            self.delete_callback,
+            self.stop_callback,
+            self.logs_callback
+        )
+        self.pool.append(card)
+        self.window_ids[card] = self.canvas.create_window(0, 0, window=card, anchor="nw", state="hidden")
+        return card
+
+    def release(self, path):
+        card = self.bound.pop(path, None)
+        if card is not None:
+            self.canvas.itemconfigure(self.window_ids[card], state="hidden")
+            self.free.append(card)
+
+    # --- Events ---
+
+    def on_canvas_configure(self, event):
+        self.update_scrollregion()
+        self.schedule_refresh()
+
+    def on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self.schedule_refresh()
+
+    def destroy(self):
+        self.unbind_wheel()
+        super().destroy()
+
+    def unbind_wheel(self):
+        # unbind_all() would also drop other widgets' handlers for the same
+        # sequence, so only our script lines are removed from the "all" tag
+        for sequence, funcid in self.wheel_bindings:
+            try:
+                script = self.tk.call("bind", "all", sequence)
+                kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+                self.tk.call("bind", "all", sequence, kept)
+                self.deletecommand(funcid)
+            except tkinter.TclError:
+                pass
+        self.wheel_bindings = []
+
+    def on_mousewheel(self, event):
+        # bind_all fires for the whole app; only react over this dashboard
+        widget = event.widget
+        if not isinstance(widget, tkinter.Misc):
+            return
+        name = str(widget)
+        if name != str(self) and not name.startswith(str(self) + "."):
+            return
+
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        elif sys.platform == "darwin":
+            step = -event.delta
+        else:
+            self.wheel_remainder += event.delta
+            step = -int(self.wheel_remainder / 120)
+            self.wheel_remainder += step * 120
+
+        if step:
+            self.canvas.yview_scroll(step, "units")
+            self.schedule_refresh()
+
+    # --- Incremental updates ---
+
+    def set_running(self, path, running):
+        if running:
+            self.running.add(path)
+        else:
+            self.running.discard(path)
+
+        if not running:
+            self.metrics.pop(path, None)
+
+        card = self.bound.get(path)
+        if card is not None:
+            card.set_running(running)
+            if not running:
+                card.set_metrics(None)
+
+    def set_metrics(self, metrics):
+        # Only cards on screen are touched; the rest pick it up when bound
+        self.metrics = metrics
+        for path, card in self.bound.items():
+            card.set_metrics(metrics.get(path))
+
+    def request_metadata(self, apps):
+        missing = [app for app in apps if app.metadata is None]
+        if missing and self.metadata_callback:
+            self.metadata_callback(missing)
+
+    def set_metadata(self, results):
+        # results: [(path, AppMetadata), ...] from the MetadataLoader
+        for path, meta in results:
+            i = self.index.get(path)
+            if i is None:
+                continue
+            app = self.apps[i]
+            app.metadata = meta
+            card = self.bound.get(path)
+            if card is not None and card.app_model is app:
+                card.set_metadata(meta)
+
+    def invalidate_metadata(self, path):
+        i = self.index.get(path)
+        if i is None:
+            return
+        app = self.apps[i]
+        app.metadata = None
+        if path in self.bound:
+            self.request_metadata([app])
+
+    def add_app(self, app):
+        self.add_apps([app])
+
+    def add_apps(self, apps):
+        # Bulk append; new apps only get a card once they scroll into view
+        apps = [app for app in apps if app.path not in self.index]
+        if not apps:
+            return
+
+        for app in apps:
+            self.index[app.path] = len(self.apps)
+            self.apps.append(app)
+        self.search.extend(apps, self.tags)
+
+        self.refilter()
+        self.update_scrollregion()
+        self.schedule_refresh()
+
+    def reconcile(self, apps):
+        """
+        Brings the dashboard in line with a fresh app list, keyed by path.
+
+        Existing apps keep their position, vanished ones are dropped and new
+        ones are appended. Only cards whose app actually changed are rebound;
+        the scroll position is left where it was.
+        """
+        incoming = AppCatalog(apps)
+
+        kept = []
+        reindex = []
+        for old in self.apps:
+            new = incoming.get(old.path)
+            if new is None:
+                continue
+            if new.signature != old.signature:
+                reindex.append(new)
+            elif new.metadata is None:
+                # Unchanged apps keep the metadata already loaded for them
+                new.metadata = old.metadata
+            kept.append(new)
+        added = [app for app in incoming if app.path not in self.index]
+
+        for path in [p for p in self.bound if p not in incoming]:
+            self.release(path)
+
+        # Only apps that appeared, vanished, changed or got new tags are re-indexed
+        old_tags, self.tags = self.tags, ConfigManager.get_app_tags()
+        for path in set(old_tags) | set(self.tags):
+            if old_tags.get(path) != self.tags.get(path) and path in incoming and path in self.index:
+                reindex.append(incoming.get(path))
+        for path in [p for p in self.index if p not in incoming]:
+            self.search.remove(path)
+        for app in reindex + added:
+            self.search.add(app, self.tags.get(app.path, ()))
+
+        changed = []
+        for path, card in self.bound.items():
+            new = incoming.get(path)
+            if Dashboard.app_changed(card.app_model, new):
+                card.set_app(new, path in self.running)
+                card.set_metrics(self.metrics.get(path))
+                changed.append(new)
+            else:
+                # Same content, just adopt the new model object
+                card.app_model = new
+        self.request_metadata(changed)
+
+        self.apps = kept + added
+        self.index = {app.path: i for i, app in enumerate(self.apps)}
+        self.refilter()
+
+        top = self.canvas.canvasy(0)
+        self.update_scrollregion()
+        self.scroll_to(top)
+        self.schedule_refresh()
+
+    @staticmethod
+    def app_changed(old, new):
+        return old.signature != new.signature
+
+    # --- Search ---
+
+    def set_query(self, text):
+        text = text.strip()
+        if text == self.query:
+            return
+        self.query = text
+        self.refilter()
+        self.canvas.yview_moveto(0)
+        self.update_scrollregion()
+        self.schedule_refresh()
+
+    def refilter(self):
+        # Recompute self.filtered after the query or the app list changed
+        self.matches = self.search.search(self.query) if self.query else None
+        if self.matches is None:
+            self.filtered = self.apps
+        else:
+            matches = self.matches
+            # Best matches first, dashboard order within the same score
+            self.filtered = sorted(
+                (app for app in self.apps if app.path in matches),
+                key=lambda app: matches[app.path]
+            )
+
+        if not self.apps:
+            self.show_empty_state()
+        elif not self.filtered:
+            self.show_empty_state(f"No apps match \"{self.query}\".")
+        else:
+            self.hide_empty_state()
+
+    def scroll_to(self, top):
+        # Restore an absolute scroll offset after the scrollregion changed
+        total = max(self.row_count() * self.row_pitch(), self.canvas.winfo_height())
+        if total > 0:
+            self.canvas.yview_moveto(top / total)
+
+    def update_app(self, app):
+        i = self.index.get(app.path)
+        if i is None:
+            self.add_app(app)
+            return
+
+        old = self.apps[i]
+        self.apps[i] = app
+        if Dashboard.app_changed(old, app):
+            self.search.add(app, self.tags.get(app.path, ()))
+        # With a query active the app may now (not) match, changing the rows
+        self.refilter()
+        top = self.canvas.canvasy(0)
+        self.update_scrollregion()
+        self.scroll_to(top)
+        self.schedule_refresh()
+
+        card = self.bound.get(app.path)
+        if card is None:
+            return
+        if Dashboard.app_changed(old, app):
+            card.set_app(app, app.path in self.running)
+            card.set_metrics(self.metrics.get(app.path))
+            self.request_metadata([app])
+        else:
+            if app.metadata is None:
+                app.metadata = old.metadata
+            card.app_model = app
+
+    def remove_app(self, path):
+        i = self.index.pop(path, None)
+        if i is None:
+            return
+
+        del self.apps[i]
+        for j in range(i, len(self.apps)):
+            self.index[self.apps[j].path] = j
+        self.release(path)
+        self.search.remove(path)
+        self.refilter()
+
+        top = self.canvas.canvasy(0)
+        self.update_scrollregion()
+        self.scroll_to(top)
+        self.schedule_refresh()
@@ -0,0 +1,100 @@
+import queue
+import threading
+import time
+
+# Virtual event used to wake the Tk loop from background threads
+WAKE_EVENT = "<<DispatchWake>>"
+
+class UiDispatcher:
+    """
+    Hands (kind, payload) messages from background threads to a handler
+    on the Tk thread.
+
+    post() queues the message and, if the UI isn't already due to drain,
+    wakes the Tk loop with a virtual event. Nothing runs while the queue is
+    idle. A drain handles messages for at most SLICE_SECONDS and then yields
+    to Tk (painting, input) before carrying on, so a flood of scan results
+    can't freeze the window.
+
+    Tcl builds without thread support can't take events from other threads;
+    there the dispatcher falls back to polling every FALLBACK_POLL_MS.
+    """
+
+    SLICE_SECONDS = 0.008
+    FALLBACK_POLL_MS = 50
+
+    def __init__(self, widget, handler):
+        self.widget = widget
+        self.handler = handler
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        # True while a drain is scheduled or running
+        self.signalled = True
+        # Wakeups are only sent once the main loop is running
+        self.ready = False
+        self.threaded = self._tcl_threaded()
+
+        if self.threaded:
+            widget.bind(WAKE_EVENT, lambda event: self.drain(), add="+")
+        # Runs once mainloop() is up; handles whatever was posted before that
+        widget.after_idle(self.start)
+
+    def _tcl_threaded(self):
+        try:
+            return bool(int(self.widget.tk.eval("set tcl_platform(threaded)")))
+        except Exception:
+            return False
+
+    def start(self):
+        self.ready = True
+        if self.threaded:
+            self.drain()
+        else:
+            self.poll()
+
+    def post(self, kind, payload):
+        # Safe to call from any thread
+        self.queue.put((kind, payload))
+        if not self.threaded:
+            return
+        with self.lock:
+            if self.signalled or not self.ready:
+                return
+            self.signalled = True
+        try:
+            self.widget.event_generate(WAKE_EVENT, when="tail")
+        except Exception:
+            # Window is being destroyed
+            with self.lock:
+                self.signalled = False
+
+    def drain(self):
+        with self.lock:
+            self.signalled = True
+
+        deadline = time.perf_counter() + self.SLICE_SECONDS
+        while True:
+            try:
+                kind, payload = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self.handler(kind, payload)
+            except Exception as e:
+                print(f"Error handling {kind} message: {e}")
+            if time.perf_counter() >= deadline:
+                # Let Tk paint and process input, then continue
+                self.widget.after(1, self.drain)
+                return
+
+        with self.lock:
+            self.signalled = False
+        # A post that raced the lock release above would have been skipped
+        if not self.queue.empty():
+            with self.lock:
+                self.signalled = True
+            self.widget.after_idle(self.drain)
+
+    def poll(self):
+        self.drain()
+        self.widget.after(self.FALLBACK_POLL_MS, self.poll)
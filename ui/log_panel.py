@@ -0,0 +1,67 @@
+import customtkinter as ctk
+
+class LogPanel(ctk.CTkToplevel):
+    """Tails a process's LogBuffer into a read-only text view."""
+
+    POLL_MS = 200
+    # Lines kept in the text widget; older ones are trimmed from the top
+    MAX_VISIBLE_LINES = 2000
+
+    def __init__(self, master, record):
+        super().__init__(master)
+        self.record = record
+        self.next_line = 0
+
+        self.title(f"Logs - {record.name}")
+        self.geometry("900x500")
+        self.configure(fg_color="#18181b") # Zinc-900
+
+        self.status_lbl = ctk.CTkLabel(
+            self,
+            text="",
+            font=("Segoe UI", 12),
+            text_color="#71717a", # Zinc-500
+            anchor="w"
+        )
+        self.status_lbl.pack(fill="x", padx=20, pady=(15, 5))
+
+        self.text = ctk.CTkTextbox(
+            self,
+            font=("Consolas", 12),
+            fg_color="#09090b",
+            text_color="#d4d4d8",
+            wrap="none"
+        )
+        self.text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.text.configure(state="disabled")
+
+        self.poll()
+
+    def poll(self):
+        if not self.winfo_exists():
+            return
+
+        wanted = self.next_line
+        first, lines, self.next_line = self.record.log.read_since(wanted)
+        if lines:
+            at_bottom = self.text.yview()[1] >= 0.999
+            self.text.configure(state="normal")
+            if first > wanted:
+                # The app outran us and the buffer already dropped these
+                self.text.insert("end", f"[... {first - wanted} lines dropped ...]\n")
+            self.text.insert("end", "\n".join(lines) + "\n")
+            self.trim()
+            self.text.configure(state="disabled")
+            if at_bottom:
+                self.text.see("end")
+
+        state = "running" if self.record.running else f"exited with code {self.record.exit_code}"
+        self.status_lbl.configure(text=f"PID {self.record.pid}  •  {state}  •  {self.next_line} lines")
+
+        self.after(self.POLL_MS, self.poll)
+
+    def trim(self):
+        line_count = int(self.text.index("end-1c").split(".")[0])
+        excess = line_count - self.MAX_VISIBLE_LINES
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
@@ -0,0 +1,193 @@
+import atexit
+import collections
+import json
+import os
+import subprocess
+import threading
+
+from config_manager import ConfigManager
+
+READY_MARKER = "__appmanager_worker_ready__"
+
+# Stdlib modules a worker imports up front; they are shared by most small
+# tools and safe to have loaded before the app starts.
+DEFAULT_MODULES = [
+    "json", "re", "os", "pathlib", "logging", "threading", "subprocess",
+    "socket", "datetime", "collections", "typing", "argparse", "tkinter"
+]
+
+# Runs inside the worker interpreter: import the common modules, report
+# ready, then wait for a single job and become that app.
+BOOTSTRAP = r"""
+import sys
+_name = None
+for _name in sys.argv[1:]:
+    try:
+        __import__(_name)
+    except Exception:
+        pass
+sys.stdout.write("%s\n")
+sys.stdout.flush()
+_line = sys.stdin.readline()
+if not _line:
+    sys.exit(0)
+import json, os, runpy
+_job = json.loads(_line)
+os.chdir(_job["cwd"])
+sys.stdin = open(os.devnull)
+sys.argv = [_job["script"]] + _job["args"]
+sys.path[0] = os.path.dirname(os.path.abspath(_job["script"]))
+del _name, _line, _job
+runpy.run_path(sys.argv[0], run_name="__main__")
+""" % READY_MARKER
+
+class WarmWorker:
+    """A pre-started interpreter waiting on stdin for the script to run."""
+
+    def __init__(self, interpreter, modules):
+        self.interpreter = interpreter
+        self.ready = threading.Event()
+
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+        else:
+            kwargs["start_new_session"] = True
+
+        self.popen = subprocess.Popen(
+            [interpreter, "-u", "-c", BOOTSTRAP] + list(modules),
+            cwd=os.path.expanduser("~"),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            **kwargs
+        )
+        threading.Thread(target=self._await_ready, daemon=True).start()
+
+    def _await_ready(self):
+        try:
+            line = self.popen.stdout.readline()
+        except Exception:
+            return
+        if line.decode("utf-8", errors="replace").strip() == READY_MARKER:
+            self.ready.set()
+
+    @property
+    def alive(self):
+        return self.popen.poll() is None
+
+    def start(self, script, cwd, args=()):
+        # Hand over the job; from here on this process *is* the app
+        job = json.dumps({"script": script, "cwd": cwd, "args": list(args)})
+        try:
+            self.popen.stdin.write(job.encode("utf-8") + b"\n")
+            self.popen.stdin.close()
+        except OSError as e:
+            print(f"Warm worker went away: {e}")
+            return None
+        return self.popen
+
+    def discard(self):
+        # EOF on stdin makes an idle worker exit on its own
+        try:
+            self.popen.stdin.close()
+        except Exception:
+            pass
+
+class WarmPool:
+    """
+    Keeps `size` ready workers per interpreter for fast launches.
+
+    Only the `max_interpreters` most recently used interpreters keep a pool,
+    so a machine with dozens of venvs doesn't end up with dozens of idle
+    pythons. acquire() never waits: if no warm worker is ready the caller
+    falls back to a cold launch, and the pool refills in the background.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, size=1, max_interpreters=4, modules=None):
+        self.size = size
+        self.max_interpreters = max_interpreters
+        self.modules = modules if modules is not None else DEFAULT_MODULES
+        self.lock = threading.Lock()
+        # interpreter -> deque of WarmWorker, most recently used last
+        self.pools = collections.OrderedDict()
+        # interpreter -> workers being spawned right now
+        self.starting = collections.Counter()
+
+    @staticmethod
+    def shared():
+        with WarmPool._shared_lock:
+            if WarmPool._shared is None:
+                WarmPool._shared = WarmPool(
+                    size=ConfigManager.get_fast_launch_pool_size(),
+                    modules=ConfigManager.get_fast_launch_modules()
+                )
+                atexit.register(WarmPool._shared.shutdown)
+            return WarmPool._shared
+
+    def warm(self, interpreter):
+        # Top the interpreter's pool up to `size` workers
+        evicted = []
+        with self.lock:
+            pool = self.pools.pop(interpreter, None) or collections.deque()
+            self.pools[interpreter] = pool
+
+            while len(self.pools) > self.max_interpreters:
+                _, old = self.pools.popitem(last=False)
+                evicted.extend(old)
+
+            live = [w for w in pool if w.alive]
+            pool.clear()
+            pool.extend(live)
+            missing = self.size - len(pool) - self.starting[interpreter]
+            if missing > 0:
+                self.starting[interpreter] += missing
+
+        for worker in evicted:
+            worker.discard()
+
+        for _ in range(max(0, missing)):
+            try:
+                worker = WarmWorker(interpreter, self.modules)
+            except Exception as e:
+                print(f"Error starting warm worker: {e}")
+                worker = None
+            with self.lock:
+                self.starting[interpreter] -= 1
+                if worker is None:
+                    continue
+                if interpreter in self.pools:
+                    self.pools[interpreter].append(worker)
+                else:
+                    worker.discard()
+
+    def acquire(self, interpreter):
+        """Returns a ready WarmWorker for interpreter, or None."""
+        worker = None
+        with self.lock:
+            pool = self.pools.get(interpreter)
+            if pool is not None:
+                for candidate in list(pool):
+                    if candidate.ready.is_set() and candidate.alive:
+                        pool.remove(candidate)
+                        worker = candidate
+                        break
+
+        # Refill off the caller's thread either way
+        threading.Thread(target=self.warm, args=(interpreter,), daemon=True).start()
+        return worker
+
+    def ready_count(self, interpreter):
+        with self.lock:
+            pool = self.pools.get(interpreter, ())
+            return sum(1 for w in pool if w.ready.is_set() and w.alive)
+
+    def shutdown(self):
+        with self.lock:
+            workers = [w for pool in self.pools.values() for w in pool]
+            self.pools.clear()
+        for worker in workers:
+            worker.discard()